@@ -9,7 +9,7 @@ frame *after* you finish drawing your scene.
 
 Effects implemented:
 - Scanlines (subtle, resolution‑aware)
-- Bloom/glow (fast downsample/upsample + additive)
+- Bloom/glow (single mip downsample + bilinear upsample + additive)
 - Vignette (precomputed radial falloff)
 - Rolling flicker band (animated, low amplitude)
 - Chromatic aberration (RGB sub‑pixel offsets)
@@ -18,26 +18,34 @@ All effects are tuned to be tasteful and efficient on Pi 5 @ 800×480.
 You can tweak params at the top of the class.
 """
 
+import array
 import math
+import numpy as np
 import pygame
 
+_SIN_LUT_SIZE = 1024  # power of two so the index wraps with a mask
+_SIN_LUT_SCALE = _SIN_LUT_SIZE / (2 * math.pi)
+
+
 class CRTEffects:
     def __init__(self, size, *, enable_scanlines=True, enable_bloom=True,
                  enable_vignette=True, enable_flicker=True, enable_rgb_shift=True):
         self.w, self.h = size
-        self.enable_scanlines = enable_scanlines
+        # Scanlines/vignette are baked into _mod_surface; their properties rebuild it on change
+        self._enable_scanlines = enable_scanlines
         self.enable_bloom = enable_bloom
-        self.enable_vignette = enable_vignette
+        self._enable_vignette = enable_vignette
         self.enable_flicker = enable_flicker
         self.enable_rgb_shift = enable_rgb_shift
 
         # ---- Tunables ----
         # Scanlines: intensity 0..1 (1 = dark lines fully black)
         self.scanline_strength = 0.14
-        # Bloom: 0..1 additive strength, and internal blur passes
+        # Bloom: 0..1 additive strength, and blur size (8 = sampled at 1/8 res)
         self.bloom_strength = 0.28
-        self.bloom_downscale = 2  # 2 = half res
-        self.bloom_passes = 2     # up/down smoothscale passes (2 is usually enough)
+        self.bloom_downscale = 8
+        # Bloom threshold 0..255: only levels above this glow (sampled after the vignette/scanlines)
+        self.bloom_threshold = 48
         # Vignette: 0..1 strength (darkening towards edges)
         self.vignette_strength = 0.25
         # Flicker: overall brightness modulation + rolling band
@@ -49,116 +57,152 @@ class CRTEffects:
         self.rgb_shift = (-1, 0, 1)  # R, G, B x‑offsets
 
         # ---- Precompute reusable layers ----
-        self._scan_surface = self._make_scanlines() if enable_scanlines else None
-        self._vignette_surface = self._make_vignette() if enable_vignette else None
+        # Scanlines and vignette are both static multipliers, so bake them into one layer
+        self._mod_surface = self._make_modulation()
         # Reusable temp surfaces
         self._temp_black = pygame.Surface((self.w, self.h)).convert()
         self._temp_black.set_colorkey(None)
         self._temp_black.fill((0, 0, 0))
-        self._band_surface = pygame.Surface((self.w, self.flicker_band_height_px), pygame.SRCALPHA).convert_alpha()
-        self._band_surface.fill((255, 255, 255, int(255 * self.flicker_band_amp)))
+        self._temp_black_val = 0  # grey level currently filled into _temp_black
+        # Bloom: preallocated mip + full-size buffers so the per-frame resamples don't allocate
+        dw, dh = max(1, self.w // self.bloom_downscale), max(1, self.h // self.bloom_downscale)
+        self._bloom_small = pygame.Surface((dw, dh)).convert()
+        self._bloom_full = pygame.Surface((self.w, self.h)).convert()
+        # Flicker: one-period sine table for the wobble
+        self._sin_lut = array.array('f', [math.sin(2 * math.pi * i / _SIN_LUT_SIZE) for i in range(_SIN_LUT_SIZE)])
+        # RGB shift: single-channel scratch plane reused every frame (x, y)
+        self._shift_scratch = np.empty((self.w, self.h), dtype=np.uint8)
+        # Flicker band: plain 24-bit grey, BLEND_ADD only adds RGB so no alpha channel is needed
+        band = int(255 * self.flicker_band_amp)
+        self._band_surface = pygame.Surface((self.w, self.flicker_band_height_px)).convert()
+        self._band_surface.fill((band, band, band))
 
     # ---------- Public API ----------
-    def apply(self, target_surface: pygame.Surface, dt: float) -> pygame.Surface:
+    @property
+    def enable_scanlines(self):
+        return self._enable_scanlines
+
+    @enable_scanlines.setter
+    def enable_scanlines(self, on):
+        if bool(on) != bool(self._enable_scanlines):
+            self._enable_scanlines = on
+            self._mod_surface = self._make_modulation()
+
+    @property
+    def enable_vignette(self):
+        return self._enable_vignette
+
+    @enable_vignette.setter
+    def enable_vignette(self, on):
+        if bool(on) != bool(self._enable_vignette):
+            self._enable_vignette = on
+            self._mod_surface = self._make_modulation()
+
+    def apply(self, target_surface: pygame.Surface, dt: float, now_ms=None) -> pygame.Surface:
         """Apply CRT effects in place. Returns the processed surface.
         Draw your scene to `target_surface` first, then call this.
         `dt` is seconds since last frame (for animations).
+        `now_ms` is the frame timestamp (pygame ticks); read once here if omitted.
         """
-        # Chromatic aberration (fast channel offsets via multiply+add)
+        if now_ms is None:
+            now_ms = pygame.time.get_ticks()
+
+        # Chromatic aberration (per-channel offsets via surfarray)
         if self.enable_rgb_shift:
             self._apply_rgb_shift(target_surface)
 
+        # Vignette darkening + scanlines (one combined multiply pass)
+        if self._mod_surface is not None:
+            target_surface.blit(self._mod_surface, (0, 0), special_flags=pygame.BLEND_MULT)
+
         # Bloom/glow (cheap separable blur by downsample/upsample and additive blend)
+        # Runs after the modulation so it only picks up highlights that survive it
         if self.enable_bloom:
             self._apply_bloom(target_surface)
 
-        # Vignette darkening
-        if self.enable_vignette:
-            target_surface.blit(self._vignette_surface, (0, 0), special_flags=pygame.BLEND_MULT)
-
-        # Scanlines on top
-        if self.enable_scanlines:
-            target_surface.blit(self._scan_surface, (0, 0), special_flags=pygame.BLEND_MULT)
-
         # Flicker (subtle global + rolling band)
         if self.enable_flicker:
-            self._apply_flicker(target_surface, dt)
+            self._apply_flicker(target_surface, dt, now_ms)
 
         return target_surface
 
     # ---------- Builders ----------
+    def _make_modulation(self):
+        layers = []
+        if self.enable_vignette:
+            layers.append(self._make_vignette())
+        if self.enable_scanlines:
+            layers.append(self._make_scanlines())
+        if not layers:
+            return None
+        mod = layers[0]
+        for layer in layers[1:]:
+            mod.blit(layer, (0, 0), special_flags=pygame.BLEND_MULT)
+        return mod
+
     def _make_scanlines(self) -> pygame.Surface:
-        surf = pygame.Surface((self.w, self.h)).convert()
-        surf.fill((255, 255, 255))
         dark = max(0, 255 - int(255 * self.scanline_strength))
         # Darken every other row (or every 2 rows for very tall screens)
         step = 2 if self.h >= 480 else 1
-        for y in range(0, self.h, step):
-            if (y // step) % 2 == 1:
-                pygame.draw.line(surf, (dark, dark, dark), (0, y), (self.w, y))
-        return surf
+        y = np.arange(self.h)
+        rows = np.where((y % step == 0) & ((y // step) % 2 == 1), dark, 255).astype(np.uint8)
+        # Broadcast the per-row pattern to an (x, y, rgb) array in one write
+        rgb = np.empty((self.w, self.h, 3), dtype=np.uint8)
+        rgb[:] = rows[None, :, None]
+        return pygame.surfarray.make_surface(rgb).convert()
 
     def _make_vignette(self) -> pygame.Surface:
-        vignette = pygame.Surface((self.w, self.h), pygame.SRCALPHA).convert_alpha()
         cx, cy = self.w * 0.5, self.h * 0.5
         max_r = math.hypot(cx, cy)
-        # Draw concentric translucent rings (cheap radial falloff)
-        rings = 80
-        for i in range(rings):
-            t = i / (rings - 1)
-            # Ease curve for smoother edges
-            strength = (t ** 2) * self.vignette_strength
-            alpha = int(255 * strength)
-            r = int(max_r * t)
-            pygame.draw.circle(vignette, (0, 0, 0, alpha), (int(cx), int(cy)), r)
-        # Convert to MULT surface by flattening to RGB (premultiply not needed for BLEND_MULT)
-        v_rgb = pygame.Surface((self.w, self.h)).convert()
-        v_rgb.fill((255, 255, 255))
-        v_rgb.blit(vignette, (0, 0), special_flags=pygame.BLEND_SUB)
-        return v_rgb
+        # Smooth radial falloff, built as an (x, y) array to match surfarray layout
+        x = (np.arange(self.w, dtype=np.float32) - cx)[:, None]
+        y = (np.arange(self.h, dtype=np.float32) - cy)[None, :]
+        t = np.hypot(x, y) / max_r
+        # Ease curve for smoother edges
+        alpha = np.clip((t ** 2) * self.vignette_strength * 255, 0, 255).astype(np.uint8)
+        # MULT surface: white in the centre, darker towards the corners
+        rgb = np.repeat((255 - alpha)[:, :, None], 3, axis=2)
+        return pygame.surfarray.make_surface(rgb).convert()
 
     # ---------- Passes ----------
     def _apply_bloom(self, target_surface: pygame.Surface):
-        dw, dh = max(1, self.w // self.bloom_downscale), max(1, self.h // self.bloom_downscale)
-        # Downsample
-        small = pygame.transform.smoothscale(target_surface, (dw, dh))
-        # Blur by ping‑pong smoothscale (cheap Gaussian approximation)
-        for _ in range(self.bloom_passes):
-            small = pygame.transform.smoothscale(small, (max(1, dw // 2), max(1, dh // 2)))
-            small = pygame.transform.smoothscale(small, (dw, dh))
-        # Upscale back and additively blend
-        blurred = pygame.transform.smoothscale(small, (self.w, self.h))
-        # Reduce intensity by modulating alpha via a multiplicative fill
+        small = self._bloom_small
+        # One averaging downsample to a small mip, then let the bilinear upscale do the blur
+        pygame.transform.smoothscale(target_surface, small.get_size(), small)
+        # Threshold on the mip so only highlights bloom (the target itself is left alone)
+        if self.bloom_threshold > 0:
+            thr = self.bloom_threshold
+            small.fill((thr, thr, thr), special_flags=pygame.BLEND_SUB)
+        # Attenuate on the small mip (1/64 of the pixels); the upscale is linear so it carries over
         if self.bloom_strength < 1.0:
-            # Multiply the blurred image by a gray to attenuate
             atten = int(255 * self.bloom_strength)
-            blurred_mod = blurred.copy()
-            blurred_mod.fill((atten, atten, atten), special_flags=pygame.BLEND_MULT)
-            target_surface.blit(blurred_mod, (0, 0), special_flags=pygame.BLEND_ADD)
-        else:
-            target_surface.blit(blurred, (0, 0), special_flags=pygame.BLEND_ADD)
+            small.fill((atten, atten, atten), special_flags=pygame.BLEND_MULT)
+        # Upscale back and additively blend
+        blurred = pygame.transform.smoothscale(small, (self.w, self.h), self._bloom_full)
+        target_surface.blit(blurred, (0, 0), special_flags=pygame.BLEND_ADD)
 
     def _apply_rgb_shift(self, target_surface: pygame.Surface):
-        # Build additive composite from R, G, B tinted copies with tiny offsets
-        r_off, g_off, b_off = self.rgb_shift
-        base = target_surface.copy()
-        out = self._temp_black
-        out.fill((0, 0, 0))
-
-        r = base.copy(); r.fill((255, 0, 0), special_flags=pygame.BLEND_MULT)
-        g = base.copy(); g.fill((0, 255, 0), special_flags=pygame.BLEND_MULT)
-        b = base.copy(); b.fill((0, 0, 255), special_flags=pygame.BLEND_MULT)
-
-        out.blit(r, (r_off, 0), special_flags=pygame.BLEND_ADD)
-        out.blit(g, (g_off, 0), special_flags=pygame.BLEND_ADD)
-        out.blit(b, (b_off, 0), special_flags=pygame.BLEND_ADD)
-
-        target_surface.blit(out, (0, 0))
-
-    def _apply_flicker(self, target_surface: pygame.Surface, dt: float):
+        # Shift each colour channel sideways in place (surfarray is indexed [x, y, c])
+        w = self.w
+        arr = pygame.surfarray.pixels3d(target_surface)
+        scratch = self._shift_scratch
+        for c, off in enumerate(self.rgb_shift):
+            if off == 0:
+                continue
+            np.copyto(scratch, arr[:, :, c])
+            if off > 0:
+                arr[off:, :, c] = scratch[:w - off]
+                arr[:off, :, c] = 0
+            else:
+                arr[:w + off, :, c] = scratch[-off:]
+                arr[w + off:, :, c] = 0
+        del arr  # unlock the surface before any blits
+
+    def _apply_flicker(self, target_surface: pygame.Surface, dt: float, now_ms: int):
     # Global tiny brightness wobble
-        t = pygame.time.get_ticks() * 0.001  # seconds
-        wobble = (math.sin(t * 13.0) + math.sin(t * 7.1)) * 0.5
+        t = now_ms * 0.001  # seconds
+        lut, mask = self._sin_lut, _SIN_LUT_SIZE - 1
+        wobble = (lut[int(t * (13.0 * _SIN_LUT_SCALE)) & mask] + lut[int(t * (7.1 * _SIN_LUT_SCALE)) & mask]) * 0.5
         wobble = (wobble * self.flicker_global_amp) + 1.0
 
     # Clamp to valid 0..255 range for pygame.Surface.fill()
@@ -166,10 +210,13 @@ class CRTEffects:
         if val < 0: val = 0
         if val > 255: val = 255
 
-    # Apply wobble by multiplicative gray overlay
-        overlay = self._temp_black
-        overlay.fill((val, val, val))
-        target_surface.blit(overlay, (0, 0), special_flags=pygame.BLEND_MULT)
+    # Apply wobble by multiplicative gray overlay (255 is a no-op; refill only on change)
+        if val < 255:
+            overlay = self._temp_black
+            if val != self._temp_black_val:
+                overlay.fill((val, val, val))
+                self._temp_black_val = val
+            target_surface.blit(overlay, (0, 0), special_flags=pygame.BLEND_MULT)
 
     # Rolling horizontal bright band
         y = int((t * self.flicker_band_speed_px) % (self.h + self.flicker_band_height_px)) - self.flicker_band_height_px
@@ -191,6 +238,7 @@ if __name__ == "__main__":
     running = True
     while running:
         dt = clock.tick(60) / 1000.0
+        now_ms = pygame.time.get_ticks()
         for e in pygame.event.get():
             if e.type == pygame.QUIT:
                 running = False
@@ -199,16 +247,16 @@ if __name__ == "__main__":
         screen.fill((0, 2, 0))
         # simple moving bars
         for i in range(16):
-            y = (i * 30 + (pygame.time.get_ticks() // 6)) % size[1]
+            y = (i * 30 + (now_ms // 6)) % size[1]
             pygame.draw.rect(screen, (0, 40 + i * 7, 0), (0, y, size[0], 12))
         # title
-        elapsed = (pygame.time.get_ticks() - t0) / 1000.0
+        elapsed = (now_ms - t0) / 1000.0
         msg = f"Love Machine • Pi 5 CRT Demo • {elapsed:4.1f}s"
         text = font.render(msg, True, (0, 255, 0))
         screen.blit(text, (20, 20))
 
         # Apply CRT polish last
-        crt.apply(screen, dt)
+        crt.apply(screen, dt, now_ms)
 
         pygame.display.flip()
 
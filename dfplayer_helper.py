@@ -2,10 +2,13 @@ import time
 import serial
 import threading
 
-def _checksum(payload):
-    # payload = bytes [0xFF,0x06,CMD,0x00,PH,PL]
-    s = sum(payload) & 0xFFFF
-    return ((0 - s) & 0xFFFF)
+# Fixed frame: 7E FF 06 CMD 00 PH PL CHK_H CHK_L EF  (only CMD/PH/PL/CHK change)
+_FRAME_TEMPLATE = b"\x7E\xFF\x06\x00\x00\x00\x00\x00\x00\xEF"
+_HEADER_SUM = 0xFF + 0x06  # version + length bytes, constant in every frame
+
+def _checksum(cmd, ph, pl):
+    # two's complement of the payload sum [0xFF,0x06,CMD,0x00,PH,PL]
+    return (-(_HEADER_SUM + cmd + ph + pl)) & 0xFFFF
 
 class DFPlayer:
     def __init__(self, port="/dev/serial0", baud=9600, verbose=True):
@@ -13,19 +16,23 @@ class DFPlayer:
         self.ser = serial.Serial(port, baudrate=baud, timeout=0.25)
         time.sleep(0.2)
         self._lock = threading.Lock()
+        self._frame = bytearray(_FRAME_TEMPLATE)  # reused for every command
 
     def _send(self, cmd, param=0):
         PH = (param >> 8) & 0xFF
         PL = param & 0xFF
-        payload = bytearray([0xFF, 0x06, cmd, 0x00, PH, PL])
-        chk = _checksum(payload)
-        frame = bytearray([0x7E]) + payload + bytearray([(chk >> 8) & 0xFF, chk & 0xFF, 0xEF])
+        chk = _checksum(cmd, PH, PL)
         with self._lock:
+            frame = self._frame
+            frame[3] = cmd
+            frame[5] = PH
+            frame[6] = PL
+            frame[7] = chk >> 8
+            frame[8] = chk & 0xFF
             if self.verbose:
                 print(f"[DFP] CMD=0x{cmd:02X} PARAM=0x{param:04X}")
             self.ser.write(frame)
-            self.ser.flush()
-            time.sleep(0.05)
+            self.ser.flush()  # returns once the frame is on the wire; no blanket sleep
 
     # Common commands
     def reset(self):
@@ -78,13 +85,14 @@ def start_init_loop(volume=26):
         p.single_loop_on()
 
         # Try a few play styles; one should “catch”:
+        # (a short gap lets the module latch each command before the next arrives)
         # 1) /mp3/0001.mp3 via MP3 index
         p.play_mp3_index(1)
-        time.sleep(0.5)
+        time.sleep(0.1)
 
         # 2) global index 1
         p.play_track_index_global(1)
-        time.sleep(0.5)
+        time.sleep(0.1)
 
         # 3) folder play (in case you used /01/001.mp3)
         # (harmless if folder/track doesn't exist)
@@ -25,6 +25,24 @@ def init_mixer_with_retry(retries=5, delay=0.5):
 if not init_mixer_with_retry():
     sys.exit(1)
 
+# The end-of-track event needs the video/event subsystem; on a headless Pi fall
+# back to the dummy driver, and failing that poll the mixer instead
+def init_events():
+    try:
+        pygame.display.init()
+        return True
+    except Exception:
+        pass
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    try:
+        pygame.display.init()
+        return True
+    except Exception as e:
+        print(f"[!] No event subsystem ({e}); polling the mixer instead")
+        return False
+
+events_ok = init_events()
+
 # Try to list devices (optional)
 try:
     n = pygame.mixer.get_num_audio_devices(False)
@@ -53,12 +71,21 @@ try:
     if target.lower().endswith((".wav", ".ogg", ".mp3", ".flac")):
         pygame.mixer.music.load(target)
         pygame.mixer.music.set_volume(0.9)
+        if events_ok:
+            pygame.mixer.music.set_endevent(pygame.USEREVENT)
+            # only the end-of-track event may wake us
+            pygame.event.set_blocked(None)
+            pygame.event.set_allowed([pygame.USEREVENT])
         pygame.mixer.music.play()
-        # keep process alive while playback starts/continues
-        for _ in range(40):
-            time.sleep(0.25)
-            if not pygame.mixer.music.get_busy():
-                pass
+        if events_ok:
+            # keep process alive until playback ends (max 10s), without polling
+            pygame.event.wait(timeout=10000)
+        else:
+            # keep process alive while playback continues (max 10s)
+            for _ in range(40):
+                time.sleep(0.25)
+                if not pygame.mixer.music.get_busy():
+                    break
         print("Done.")
     else:
         snd = pygame.mixer.Sound(target)
@@ -1,12 +1,28 @@
 #!/usr/bin/env python3
 # ====== Imports (order matters for audio) ======
-import os, sys, time, random, subprocess, math, threading
+import os, sys, time, random, subprocess, math, threading, atexit
+from collections import OrderedDict, deque
 
 # Force PulseAudio on Pi OS (PipeWire) BEFORE importing pygame
 os.environ.setdefault("SDL_AUDIODRIVER", "pulseaudio")
 
-import pygame
-from crt_effects import CRTEffects
+
+# pygame (+ numpy via CRT) is slow to import on the Pi: pull it in on a background
+# thread while the GPIO / PWM hardware below comes up, then wait before first use.
+_pygame_ready = threading.Event()
+
+
+def _preload_pygame():
+    try:
+        import pygame  # noqa: F401
+        import crt_effects  # noqa: F401
+    except Exception:
+        pass  # the real import below re-raises with a proper traceback
+    finally:
+        _pygame_ready.set()
+
+
+threading.Thread(target=_preload_pygame, daemon=True).start()
 
 # ====== Sensor (IR obstacle) ======
 try:
@@ -33,9 +49,16 @@ def _init_sensor_gpio():
         return
     # IMPORTANT: Power the module from **3.3V** if possible so OUT never goes to 5V.
     # If you must power it from 5V, use a level shifter or a resistor divider on OUT.
+    global _SENSOR_EDGES
     GPIO.setmode(GPIO.BCM)
     GPIO.setup(SENSOR_PIN, GPIO.IN, pull_up_down=GPIO.PUD_UP)
     time.sleep(0.08)
+    # Edge callbacks wake the paper wait on a change; the debounce itself stays time-based
+    try:
+        GPIO.add_event_detect(SENSOR_PIN, GPIO.BOTH, callback=lambda _ch: _SENSOR_EDGE.set())
+        _SENSOR_EDGES = True
+    except Exception as e:
+        print(f"[WARN] Sensor edge detection unavailable ({e}); polling instead")
 
 
 def _sensor_read_active() -> bool:
@@ -45,6 +68,20 @@ def _sensor_read_active() -> bool:
     return (v == 0) if SENSOR_ACTIVE_LOW else (v == 1)
 
 
+_SENSOR_EDGE = threading.Event()
+_SENSOR_EDGES = False
+SENSOR_IDLE_POLL_S = 0.05  # with edge callbacks: how often the wait still pumps events / face
+
+
+def _sensor_wait(timeout_s):
+    """Sleep until the sensor pin changes (with edge callbacks) or timeout_s passes."""
+    if _SENSOR_EDGES:
+        _SENSOR_EDGE.wait(timeout_s)
+        _SENSOR_EDGE.clear()
+    else:
+        time.sleep(timeout_s)
+
+
 from pwm_helper import init_pwm, set_brightness
 init_pwm()                   # start hardware PWM
 set_brightness(0.22)         # force ambient immediately (0.22 = 22%)
@@ -54,20 +91,142 @@ from quiz_data import QUESTIONS, CATEGORY_BLURBS
 
 print(f"[quiz] Loaded {len(CATEGORY_BLURBS or {})} archetype categories.")
 
+# Hardware is up; pygame should be imported by now (cached in sys.modules)
+_pygame_ready.wait()
+import numpy as np
+import pygame
+from crt_effects import CRTEffects
+
 def to_caps(s: str) -> str:
     return (s or "").strip().upper()
 
 
+# ====== Title music (picked before mixer init so the mixer can match its rate) ======
+ASSETS_DIR = os.path.join(os.path.dirname(__file__), "assets")
+MUSIC_DIR = os.path.join(ASSETS_DIR, "music")
+_AUDIO_EXTS = (".wav", ".ogg", ".mp3", ".flac")
+
+# The shipped PCM WAV comes first: it plays without decoding and needs no
+# transcode (a second PCM copy of the .ogg would just fill the SD card)
+_TITLE_CANDIDATES = [
+    "Foreigner - know what love is (PCM).wav",
+    "Foreigner - know what love is.ogg",
+    "Foreigner - know what love is.wav",
+]
+
+
+def _find_title_track():
+    # One directory read; names keyed lowercase (scandir avoids a stat per isfile)
+    try:
+        with os.scandir(MUSIC_DIR) as it:
+            entries = {e.name.lower(): e.name for e in it if e.is_file()}
+    except FileNotFoundError:
+        return None
+    for name in _TITLE_CANDIDATES:
+        found = entries.get(name.lower())
+        if found:
+            return os.path.join(MUSIC_DIR, found)
+    audio = sorted(low for low in entries if low.endswith(_AUDIO_EXTS))
+    for low in audio:
+        if ("foreigner" in low) and ("know what love is" in low):
+            return os.path.join(MUSIC_DIR, entries[low])
+    if audio:
+        return os.path.join(MUSIC_DIR, entries[audio[0]])
+    return None
+
+
+PCM_CACHE_TIMEOUT_S = float(os.getenv("LM_PCM_TIMEOUT", "60"))
+
+
+def _cached_pcm(path):
+    """Transcode a compressed track to a sibling 16-bit PCM WAV once, then reuse it.
+
+    Playing PCM keeps Vorbis/MP3 decode off the CPU for the whole title loop.
+    The cache is rebuilt if the source file is newer than it.
+    Falls back to the original file if ffmpeg is missing, or the transcode fails
+    or takes longer than PCM_CACHE_TIMEOUT_S.
+    """
+    if not path or path.lower().endswith(".wav"):
+        return path
+    cached = path + ".pcm.wav"
+    try:
+        # reuse only if it's at least as new as the source (a replaced track re-transcodes)
+        if os.path.getmtime(cached) >= os.path.getmtime(path):
+            return cached
+    except OSError:
+        pass
+    import shutil
+    ffmpeg = shutil.which("ffmpeg")
+    if not ffmpeg:
+        return path
+    tmp = cached + ".tmp"
+    print(f"[audio] First run: converting {os.path.basename(path)} to PCM WAV...")
+    try:
+        subprocess.run(
+            [ffmpeg, "-y", "-loglevel", "error", "-i", path,
+             "-ac", "2", "-acodec", "pcm_s16le", "-f", "wav", tmp],
+            check=True,
+            timeout=PCM_CACHE_TIMEOUT_S,  # runs before set_mode: never leave the kiosk black
+        )
+        os.replace(tmp, cached)  # only a complete file ever lands at the cache path
+        return cached
+    except Exception as e:
+        print(f"[WARN] PCM cache failed, streaming original: {e}")
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        return path
+
+
+TITLE_MUSIC = _cached_pcm(_find_title_track())
+
+
+def _probe_sample_rate(path):
+    """Read the sample rate from a WAV/OGG header; None if unknown (e.g. MP3)."""
+    if not path:
+        return None
+    low = path.lower()
+    try:
+        if low.endswith(".wav"):
+            with open(path, "rb") as f:
+                if f.read(4) != b"RIFF":
+                    return None  # not really a WAV (e.g. an MP3 renamed); let SDL sort it out
+            import wave
+            with wave.open(path, "rb") as w:
+                return w.getframerate()
+        if low.endswith(".ogg"):
+            with open(path, "rb") as f:
+                head = f.read(128)
+            i = head.find(b"\x01vorbis")
+            if i >= 0:
+                # packet type + "vorbis", u32 version, u8 channels, u32 sample rate
+                return int.from_bytes(head[i + 12 : i + 16], "little")
+    except Exception as e:
+        print(f"[WARN] Could not read sample rate of {os.path.basename(path)}: {e}")
+    return None
+
+
+# Run the mixer at the title track's native rate so SDL doesn't resample it
+# every buffer; 48kHz (USB audio) when the file can't be probed.
+MIXER_FREQ = _probe_sample_rate(TITLE_MUSIC) or 48000
+
+
 # ====== Audio: robust initialisation ======
+# Mixer buffer in frames: 2048 (~43ms at 48kHz) is safe on the Pi's USB output.
+# Try LM_MIXBUF=1024 or 512 for snappier keyclicks; go back up if audio crackles.
+MIXER_BUFFER = int(os.getenv("LM_MIXBUF", "2048"))
+
+
 def _init_audio(retries=5, delay=0.4):
-    # Best match for USB audio — 48kHz, larger buffer
+    # Match the title track's rate (48kHz for the USB audio default)
     try:
-        pygame.mixer.pre_init(frequency=48000, size=-16, channels=2, buffer=2048)
+        pygame.mixer.pre_init(frequency=MIXER_FREQ, size=-16, channels=2, buffer=MIXER_BUFFER)
         pygame.init()
         last = None
         for _ in range(retries):
             try:
-                pygame.mixer.init(frequency=48000, size=-16, channels=2, buffer=2048)
+                pygame.mixer.init(frequency=MIXER_FREQ, size=-16, channels=2, buffer=MIXER_BUFFER)
                 return True
             except Exception as e:
                 last = e
@@ -81,6 +240,16 @@ def _init_audio(retries=5, delay=0.4):
 
 _init_audio()
 
+
+def _note_asset_rate(path):
+    # SDL_mixer converts a Sound to the mixer format once, in Sound(); playback never
+    # resamples. Just say so when an asset pays that cost, so it can be re-exported.
+    rate = _probe_sample_rate(path)
+    mix = pygame.mixer.get_init()
+    if rate and mix and rate != mix[0]:
+        print(f"[audio] {os.path.basename(path)} is {rate} Hz; converted to {mix[0]} Hz at load")
+
+
 # ====== Key-press sound (for typewriter output only) ======
 KEYCLICK_PATH = os.path.join(os.path.dirname(__file__), "assets", "key_press.wav")
 KEYCLICK_SND = None
@@ -98,6 +267,7 @@ def _init_keyclick():
         if os.path.isfile(KEYCLICK_PATH):
             KEYCLICK_SND = pygame.mixer.Sound(KEYCLICK_PATH)
             KEYCLICK_SND.set_volume(0.2)  # adjust to taste
+            _note_asset_rate(KEYCLICK_PATH)
         base = 3  # channels 3–5 kept for clicks; 7 is boot loop
         _KEYCLICK_CHS = [pygame.mixer.Channel(base + i) for i in range(3)]
     except Exception as e:
@@ -153,25 +323,55 @@ else:
 WIDTH, HEIGHT = LOGICAL_W, LOGICAL_H
 TARGET_RATIO = 4 / 3
 
-if DEV_WINDOWED:
-    display = pygame.display.set_mode((LOGICAL_W, LOGICAL_H))
-else:
-    _info = pygame.display.Info()
-    display = pygame.display.set_mode((_info.current_w, _info.current_h), pygame.FULLSCREEN)
+# The window is the logical canvas; SDL's renderer does the 4:3 letterbox + upscale
+# on the GPU (linear filtering). Falls back to scaling on the CPU in present() if the
+# SCALED renderer can't be created.
+os.environ.setdefault("SDL_RENDER_SCALE_QUALITY", "1")
+_SOFT_SCALE = _get_env_flag("LM_SOFTSCALE", False)  # force the CPU path (debugging)
+if not _SOFT_SCALE:
+    _mode_flags = pygame.SCALED | (0 if DEV_WINDOWED else pygame.FULLSCREEN)
+    try:
+        try:
+            display = pygame.display.set_mode((LOGICAL_W, LOGICAL_H), _mode_flags, vsync=1)
+        except pygame.error:
+            display = pygame.display.set_mode((LOGICAL_W, LOGICAL_H), _mode_flags)
+    except pygame.error as e:
+        print(f"[WARN] SCALED display unavailable ({e}); scaling on the CPU")
+        _SOFT_SCALE = True
+if _SOFT_SCALE:
+    if DEV_WINDOWED:
+        display = pygame.display.set_mode((LOGICAL_W, LOGICAL_H))
+    else:
+        _info = pygame.display.Info()
+        display = pygame.display.set_mode((_info.current_w, _info.current_h), pygame.FULLSCREEN)
 
 pygame.display.set_caption("Love Machine")
 pygame.mouse.set_visible(False)
+# Only keys and quit are ever handled; let SDL drop mouse/window/etc. before Python sees them
+pygame.event.set_blocked(None)
+pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP])
 clock = pygame.time.Clock()
 
-screen = pygame.Surface((LOGICAL_W, LOGICAL_H)).convert()
+if not _SOFT_SCALE:
+    screen = display  # draw straight into the (logical-sized) window surface
+else:
+    screen = pygame.Surface((LOGICAL_W, LOGICAL_H)).convert()
 
-if DEV_WINDOWED:
+_INT_SCALE = False
+if not _SOFT_SCALE or DEV_WINDOWED:
     DEST_W, DEST_H = LOGICAL_W, LOGICAL_H
     DEST_X, DEST_Y = 0, 0
 else:
     _info = pygame.display.Info()
     sw, sh = _info.current_w, _info.current_h
-    if sw / sh > TARGET_RATIO:
+    # Prefer a whole-number upscale (nearest-neighbour keeps the scanlines crisp and
+    # is far cheaper than bilinear), but only when it fills most of the screen height;
+    # otherwise (e.g. 960x720 on 1080p would stay at 1x) fit-to-aspect with smoothscale
+    SCALE = min(sw // LOGICAL_W, sh // LOGICAL_H)
+    if SCALE >= 1 and SCALE * LOGICAL_H >= 0.9 * sh:
+        _INT_SCALE = True
+        DEST_W, DEST_H = LOGICAL_W * SCALE, LOGICAL_H * SCALE
+    elif sw / sh > TARGET_RATIO:
         DEST_H = sh
         DEST_W = int(DEST_H * TARGET_RATIO)
     else:
@@ -180,6 +380,14 @@ else:
     DEST_X = (sw - DEST_W) // 2
     DEST_Y = (sh - DEST_H) // 2
 
+# CPU path only: preallocated scale target; letterbox bars are cleared once here
+_scaled_buf = None
+if _SOFT_SCALE:
+    display.fill((0, 0, 0))
+    if (DEST_W, DEST_H) != (LOGICAL_W, LOGICAL_H):
+        _scaled_buf = pygame.Surface((DEST_W, DEST_H)).convert()
+        _scale_to = pygame.transform.scale if _INT_SCALE else pygame.transform.smoothscale
+
 
 # ====== Caret helper ======
 def draw_caret(surface, x, y, font_obj, color=(0, 255, 0)):
@@ -189,15 +397,33 @@ def draw_caret(surface, x, y, font_obj, color=(0, 255, 0)):
     pygame.draw.rect(surface, color, (x, top_y, w, h))
 
 
+# Caret-less copy of the last composed frame (taken before present() runs the CRT
+# pass), so a blink toggle restores it with one blit instead of recomposing the screen
+_CLEAN_FRAME = pygame.Surface((LOGICAL_W, LOGICAL_H)).convert()
+
+
+def present_caret_blink(caret_on, x, y, font_obj):
+    screen.blit(_CLEAN_FRAME, (0, 0))
+    if caret_on:
+        draw_caret(screen, x, y, font_obj)
+    present()
+
+
 # ====== CRT ======
+# LM_CRT=0 skips the post pass entirely (plain output, or to measure what it costs)
+_CRT_ON = _get_env_flag("LM_CRT", True)
 crt = CRTEffects((LOGICAL_W, LOGICAL_H), enable_flicker=False)
 
 
 def present():
-    crt.apply(screen, 0.0)
-    scaled = pygame.transform.smoothscale(screen, (DEST_W, DEST_H))
-    display.fill((0, 0, 0))
-    display.blit(scaled, (DEST_X, DEST_Y))
+    if _CRT_ON:
+        crt.apply(screen, 0.0)
+    if _SOFT_SCALE:
+        if _scaled_buf is not None:
+            _scale_to(screen, (DEST_W, DEST_H), _scaled_buf)
+            display.blit(_scaled_buf, (DEST_X, DEST_Y))
+        else:
+            display.blit(screen, (DEST_X, DEST_Y))
     pygame.display.flip()
 
 
@@ -207,11 +433,11 @@ def present():
 _EXIT_HOLD_MS = 700               # hold F12 to quit
 _ESC_TAP_WINDOW_MS = 900          # 3x ESC within this window = reset to title
 _f12_down_at = None
-_esc_taps = []
+_esc_taps = deque(maxlen=8)       # tap times, oldest first
 
 # You already added these earlier, but keep them here with the rest for clarity:
 _F10_TAP_WINDOW_MS = 2000         # 5x F10 within 2s = quit to desktop
-_f10_taps = []
+_f10_taps = deque(maxlen=16)
 
 # ====== Soft reset to title support ======
 class ResetToTitle(Exception):
@@ -230,16 +456,15 @@ def _reset_guard():
 
 
 
-def _dev_exit_check(ev_iterable):
+def _handle_events(evs):
     """
-    Wrap your event iterator:
+    Dev/kiosk exits for a batch of events (plain function, no generator):
       - ESC x3 within window => request soft reset to title
       - F10 x5 within 2s     => quit to desktop
       - Hold F12             => quit to desktop
       - In DEV_WINDOWED mode => single ESC quits (unchanged)
-    Yields all events back to caller.
     """
-    global _f12_down_at, _esc_taps, _f10_taps
+    global _f12_down_at
 
     now = pygame.time.get_ticks()
     DEV_W = globals().get("DEV_WINDOWED", False)
@@ -252,7 +477,7 @@ def _dev_exit_check(ev_iterable):
             pygame.quit()
             sys.exit()
 
-    for ev in ev_iterable:
+    for ev in evs:
         # Always handle hard quits
         if ev.type == pygame.QUIT:
             pygame.quit()
@@ -271,7 +496,8 @@ def _dev_exit_check(ev_iterable):
 
         # ---------- ESC x3 => Soft reset (do NOT quit) ----------
         if ev.type == pygame.KEYDOWN and ev.key == pygame.K_ESCAPE:
-            _esc_taps = [t for t in _esc_taps if now - t <= _ESC_TAP_WINDOW_MS]
+            while _esc_taps and now - _esc_taps[0] > _ESC_TAP_WINDOW_MS:
+                _esc_taps.popleft()
             _esc_taps.append(now)
             if len(_esc_taps) >= 3:
                 print("[RESET] ESC x3 → reset to start.")
@@ -279,71 +505,50 @@ def _dev_exit_check(ev_iterable):
 
         # ---------- F10 x5 => Quit to desktop ----------
         if ev.type == pygame.KEYDOWN and ev.key == pygame.K_F10:
-            _f10_taps = [t for t in _f10_taps if now - t <= _F10_TAP_WINDOW_MS]
+            while _f10_taps and now - _f10_taps[0] > _F10_TAP_WINDOW_MS:
+                _f10_taps.popleft()
             _f10_taps.append(now)
             if len(_f10_taps) >= 5:
                 print("[EXIT] F10 x5. Exiting to desktop.")
                 pygame.quit()
                 sys.exit()
 
-        # Yield original event back to caller
-        yield ev
-
 
 def events():
+    """Drain the queue through the dev/kiosk exits and return the events as a list."""
     # If ESC×3 requested a reset, interrupt the current screen immediately
     if _RESET_REQUESTED:
         raise ResetToTitle()
-    yield from _dev_exit_check(pygame.event.get())
+    evs = pygame.event.get()
+    if evs:
+        _handle_events(evs)
+    return evs
 
 
 # ====== Paths & font ======
-ASSETS_DIR = os.path.join(os.path.dirname(__file__), "assets")
 FONT_PATH = os.path.join(ASSETS_DIR, "Px437_IBM_DOS_ISO8.ttf")
 FONT_SIZE = int(os.getenv("LM_FONT", "40"))
 font = pygame.font.Font(FONT_PATH, FONT_SIZE)
 
 # ====== Music ======
-MUSIC_DIR = os.path.join(ASSETS_DIR, "music")
-_AUDIO_EXTS = (".wav", ".ogg", ".mp3", ".flac")
-
-_TITLE_CANDIDATES = [
-    "Foreigner - know what love is.ogg",
-    "Foreigner - know what love is (PCM).wav",
-    "Foreigner - know what love is.wav",
-]
-
-
-def _find_title_track():
-    for name in _TITLE_CANDIDATES:
-        p = os.path.join(MUSIC_DIR, name)
-        if os.path.isfile(p):
-            return p
-    try:
-        for fname in os.listdir(MUSIC_DIR):
-            low = fname.lower()
-            if low.endswith(_AUDIO_EXTS) and ("foreigner" in low) and ("know what love is" in low):
-                return os.path.join(MUSIC_DIR, fname)
-    except FileNotFoundError:
-        pass
-    try:
-        for fname in sorted(os.listdir(MUSIC_DIR)):
-            if fname.lower().endswith(_AUDIO_EXTS):
-                return os.path.join(MUSIC_DIR, fname)
-    except FileNotFoundError:
-        pass
-    return None
-
-
-TITLE_MUSIC = _find_title_track()
+# A title track under this size is decoded once into a Sound and looped on its own
+# channel (6); anything bigger streams through pygame.mixer.music as before.
+TITLE_SOUND_MAX_BYTES = 10 * 1024 * 1024
+TITLE_SOUND = None
+TITLE_CH = None
 
 
 def _load_title_music():
+    global TITLE_SOUND, TITLE_CH
     if not TITLE_MUSIC:
         print(f"[WARN] No audio file found in {MUSIC_DIR}")
         return False
     try:
-        pygame.mixer.music.load(TITLE_MUSIC)
+        if os.path.getsize(TITLE_MUSIC) < TITLE_SOUND_MAX_BYTES:
+            TITLE_SOUND = pygame.mixer.Sound(TITLE_MUSIC)
+            TITLE_CH = pygame.mixer.Channel(6)
+        else:
+            pygame.mixer.music.load(TITLE_MUSIC)
         print(f"[audio] Loaded: {os.path.basename(TITLE_MUSIC)}")
         return True
     except Exception as e:
@@ -352,6 +557,29 @@ def _load_title_music():
         return False
 
 
+def title_music_play(volume, fade_ms):
+    if TITLE_SOUND is not None:
+        TITLE_SOUND.set_volume(volume)
+        TITLE_CH.play(TITLE_SOUND, loops=-1, fade_ms=fade_ms)
+    else:
+        pygame.mixer.music.set_volume(volume)
+        pygame.mixer.music.play(loops=-1, fade_ms=fade_ms)
+
+
+def title_music_fadeout(ms):
+    if TITLE_CH is not None:
+        TITLE_CH.fadeout(ms)
+    else:
+        pygame.mixer.music.fadeout(ms)
+
+
+def title_music_stop():
+    if TITLE_CH is not None:
+        TITLE_CH.stop()
+    else:
+        pygame.mixer.music.stop()
+
+
 _music_ready = _load_title_music()
 title_music_started = False
 
@@ -371,6 +599,7 @@ def _init_boot_sound():
         if BOOT_SOUND is None:
             if os.path.isfile(BOOT_MUSIC_PATH):
                 BOOT_SOUND = pygame.mixer.Sound(BOOT_MUSIC_PATH)
+                _note_asset_rate(BOOT_MUSIC_PATH)
                 print(f"[audio] Boot loop loaded: {os.path.basename(BOOT_MUSIC_PATH)}")
                 return True
             else:
@@ -470,6 +699,54 @@ ELLIPSIS_AFTER_PAUSE_MS = 350
 
 TITLE_FADE_MS = 3000
 
+
+def _blink_now(period_ms=BLINK_INTERVAL_MS):
+    """Caret phase straight off the tick counter: on for one period, off for the next."""
+    return ((pygame.time.get_ticks() // period_ms) & 1) == 0
+
+# ====== Text render cache ======
+# The same (text, colour) pairs get re-rendered every frame by the typing/wait loops
+_TEXT_CACHE = OrderedDict()
+_TEXT_CACHE_MAX = 512
+
+
+def render_cached(s, color=TEXT, font_obj=None):
+    f = font_obj or font
+    key = (s, color, f)
+    surf = _TEXT_CACHE.get(key)
+    if surf is None:
+        # Match the display format once here so every later blit is a straight copy
+        surf = f.render(s, True, color).convert_alpha()
+        _TEXT_CACHE[key] = surf
+        if len(_TEXT_CACHE) > _TEXT_CACHE_MAX:
+            _TEXT_CACHE.popitem(last=False)
+    else:
+        _TEXT_CACHE.move_to_end(key)
+    return surf
+
+
+# Whole wrapped blocks (show_text_block's resting page) as one surface, so a
+# recompose is a single blit however many lines the block has
+_BLOCK_CACHE = OrderedDict()
+_BLOCK_CACHE_MAX = 32
+
+
+def render_block_cached(lines, line_spacing, color=TEXT):
+    key = (tuple(lines), line_spacing, color)
+    surf = _BLOCK_CACHE.get(key)
+    if surf is None:
+        line_surfs = [render_cached(ln, color) for ln in lines]
+        w = max([1] + [ls.get_width() for ls in line_surfs])
+        h = (len(line_surfs) - 1) * line_spacing + font.get_height() if line_surfs else 1
+        surf = pygame.Surface((w, h), pygame.SRCALPHA).convert_alpha()
+        surf.blits([(ls, (0, i * line_spacing)) for i, ls in enumerate(line_surfs)], doreturn=False)
+        _BLOCK_CACHE[key] = surf
+        if len(_BLOCK_CACHE) > _BLOCK_CACHE_MAX:
+            _BLOCK_CACHE.popitem(last=False)
+    else:
+        _BLOCK_CACHE.move_to_end(key)
+    return surf
+
 # ==== Quiz stats persistence ====
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(PROJECT_ROOT, "data")
@@ -493,17 +770,45 @@ def _load_stats():
 
 def _save_stats(stats):
     import json
-    with open(STATS_PATH, "w", encoding="utf-8") as f:
+    os.makedirs(DATA_DIR, exist_ok=True)
+    tmp = STATS_PATH + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
         json.dump(stats, f, indent=2)
+    os.replace(tmp, STATS_PATH)  # atomic: never leaves a half-written stats file
+
+
+# Stats live in RAM after the first tally; disk is written every N tallies and at exit.
+# Default 1 = every participant (the Pi may just get switched off at the wall).
+STATS_FLUSH_EVERY = max(1, int(os.getenv("LM_STATS_FLUSH_EVERY", "1")))
+_STATS = None
+_STATS_UNSAVED = 0
+
+
+def _flush_stats():
+    global _STATS_UNSAVED
+    if _STATS is not None and _STATS_UNSAVED:
+        _save_stats(_STATS)
+        _STATS_UNSAVED = 0
+
+
+atexit.register(_flush_stats)
 
 
 def _tally_category_count(chosen_category):
-    stats = _load_stats()
+    global _STATS, _STATS_UNSAVED
+    if _STATS is None:
+        _STATS = _load_stats()
+    stats = _STATS
     cats = stats.get("categories", {})
     cats[chosen_category] = cats.get(chosen_category, 0) + 1
     stats["categories"] = cats
     stats["total"] = stats.get("total", 0) + 1
-    _save_stats(stats)
+    _STATS_UNSAVED += 1
+    if _STATS_UNSAVED >= STATS_FLUSH_EVERY:
+        try:
+            _flush_stats()
+        except Exception as e:
+            print(f"[WARN] Could not save stats: {e}")
     total = max(stats["total"], 1)
     pct = round(cats[chosen_category] * 100 / total)
     return pct, dict(cats), total
@@ -513,30 +818,38 @@ def _tally_category_count(chosen_category):
 AMBIENT_LIGHT = 0.22
 SHOW_LIGHT = 0.90
 
+# Half-cosine ease-in-out, sampled once (plain tuple: scalar indexing beats numpy here)
+_EASE_STEPS = 255
+_EASE_LUT = tuple(0.5 - 0.5 * math.cos(math.pi * i / _EASE_STEPS) for i in range(_EASE_STEPS + 1))
+
 
 class LightPWM:
     def __init__(self, ambient=AMBIENT_LIGHT):
         self.level = ambient
         self.target = ambient
         self.duration = 0.2
+        self.inv_duration = 1.0 / self.duration
         self.start_time = time.time()
         self.start_level = ambient
         self._stop = False
         self._lock = threading.Lock()
+        self._cv = threading.Condition(self._lock)  # runner parks on this between fades
         set_brightness(self.level)
         self._thread = threading.Thread(target=self._runner, daemon=True)
         self._thread.start()
 
     def _apply(self, x: float):
-        x = 0.0 if x < 0 else (1.0 if x > 1.0 else x)
+        x = min(1.0, max(0.0, x))
         set_brightness(x)
 
     def fade_to(self, level01: float, duration_s: float):
-        with self._lock:
+        with self._cv:
             self.start_time = time.time()
             self.start_level = self.level
-            self.target = 0.0 if level01 < 0 else (1.0 if level01 > 1.0 else level01)
+            self.target = min(1.0, max(0.0, float(level01)))
             self.duration = 0.05 if duration_s < 0.05 else float(duration_s)
+            self.inv_duration = 1.0 / self.duration  # runner multiplies instead of dividing each step
+            self._cv.notify_all()
 
     def fade_up(self, to=SHOW_LIGHT, duration_ms=2500):
         self.fade_to(to, duration_ms / 1000.0)
@@ -545,21 +858,33 @@ class LightPWM:
         self.fade_to(ambient, duration_ms / 1000.0)
 
     def _runner(self):
-        while not self._stop:
-            time.sleep(0.01)
-            with self._lock:
+        while True:
+            with self._cv:
+                # Nothing fading: sleep until fade_to() or stop() wakes us
+                while not self._stop and self.level == self.target:
+                    self._cv.wait()
+                if self._stop:
+                    return
                 if self.duration <= 0:
                     cur = self.target
                 else:
-                    t = (time.time() - self.start_time) / self.duration
-                    t = 0.0 if t < 0 else (1.0 if t > 1.0 else t)
-                    eased = 0.5 - 0.5 * math.cos(math.pi * t)
-                    cur = self.start_level + (self.target - self.start_level) * eased
+                    t = (time.time() - self.start_time) * self.inv_duration
+                    if t >= 1.0:
+                        cur = self.target  # land exactly so the runner can park
+                    else:
+                        t = 0.0 if t < 0 else t
+                        eased = _EASE_LUT[int(t * _EASE_STEPS)]
+                        cur = self.start_level + (self.target - self.start_level) * eased
                 self.level = cur
-            set_brightness(self.level)
+            set_brightness(cur)
+            with self._cv:
+                if not self._stop and self.level != self.target:
+                    self._cv.wait(timeout=0.016)  # ~one frame between fade steps
 
     def stop(self, turn_off=False):
-        self._stop = True
+        with self._cv:
+            self._stop = True
+            self._cv.notify_all()
         try:
             self._thread.join(timeout=1)
         except Exception:
@@ -582,35 +907,91 @@ def lights_fade_down():
 
 
 # ====== Utility timing ======
-def soft_wait(ms):
-    end = pygame.time.get_ticks() + ms
-    while pygame.time.get_ticks() < end:
-        for _event in events():
-            pass
-            _reset_guard()
+# Windows sleeps in ~15ms steps by default; ask for 1ms so typing pacing holds up
+# on dev laptops. Linux/the Pi already has fine-grained sleeps.
+if sys.platform == "win32":
+    try:
+        import ctypes
+        ctypes.windll.winmm.timeBeginPeriod(1)
+        atexit.register(ctypes.windll.winmm.timeEndPeriod, 1)
+    except Exception as e:
+        print(f"[WARN] timeBeginPeriod failed: {e}")
+
 
-        clock.tick(240)
+def soft_wait(ms):
+    # Block in SDL until an event or the deadline; capped so F12-hold/reset still get checked
+    deadline = pygame.time.get_ticks() + ms
+    while True:
+        _reset_guard()
+        remaining = deadline - pygame.time.get_ticks()
+        if remaining <= 0:
+            return
+        ev = pygame.event.wait(min(remaining, 50))
+        if ev.type != pygame.NOEVENT:
+            _handle_events([ev])
 
 
 def wait_for_enter_release(timeout_ms=800):
-    start = pygame.time.get_ticks()
     keys = pygame.key.get_pressed()
     if not (keys[pygame.K_RETURN] or keys[pygame.K_KP_ENTER]):
         return
+    # Sleep in SDL until the next event (or the timeout) instead of polling
+    deadline = pygame.time.get_ticks() + timeout_ms
     while True:
-        for _ in events():
-            pass
-        keys = pygame.key.get_pressed()
-        if not (keys[pygame.K_RETURN] or keys[pygame.K_KP_ENTER]):
+        _reset_guard()
+        remaining = deadline - pygame.time.get_ticks()
+        if remaining <= 0:
             return
-        if pygame.time.get_ticks() - start >= timeout_ms:
+        ev = pygame.event.wait(remaining)
+        if ev.type == pygame.NOEVENT:
+            return  # timed out
+        _handle_events([ev])
+        if ev.type == pygame.KEYUP and ev.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
             return
-        clock.tick(120)
 
 
 # ====== Letter-by-letter typing helpers ======
-def type_out_line_letterwise(
-    line,
+# Lines already typed (and the face) only change between lines, so they're kept on
+# this backdrop; frames copy it and add the growing prefix. Consecutive lines of the
+# same block only blit the newly finished line instead of recomposing the lot.
+_TYPING_BG = pygame.Surface((WIDTH, HEIGHT)).convert()
+_TYPING_BG_KEY = None
+_TYPING_BG_LINES = ()
+
+
+def _typing_backdrop(drawn_lines, x, base_y, line_spacing, face_key=None):
+    global _TYPING_BG_KEY, _TYPING_BG_LINES
+    key = (x, base_y, line_spacing, face_key)
+    n = len(_TYPING_BG_LINES)
+    if key != _TYPING_BG_KEY or tuple(drawn_lines[:n]) != _TYPING_BG_LINES:
+        _TYPING_BG.fill(BG)
+        n = 0
+    _TYPING_BG.blits(
+        [(render_cached(drawn_lines[i]), (x, base_y + i * line_spacing)) for i in range(n, len(drawn_lines))],
+        doreturn=False,
+    )
+    _TYPING_BG_KEY = key
+    _TYPING_BG_LINES = tuple(drawn_lines)
+    return _TYPING_BG
+
+
+def _prefix_surfaces(target):
+    # Prefixes are clipped views of the cached full line (no kerning, so a prefix
+    # is exactly the line cut at its advance width): one render however long the line
+    if not target:
+        return []
+    full = render_cached(target)
+    fw, h = full.get_size()
+    views, w = [], 0
+    for ch in target:
+        o = ord(ch)
+        w += _CHAR_W[o] if o < 128 else font.size(ch)[0]  # running advance, same as swidth
+        views.append(full.subsurface((0, 0, min(fw, w), h)))
+    return views
+
+
+def type_out_lines_letterwise(
+    lines,
     drawn_lines,
     x,
     base_y,
@@ -619,165 +1000,281 @@ def type_out_line_letterwise(
     glitch=False,
     play_key_sound=True,
 ):
-    target = (line or "")
+    """Type several lines in one loop, appending each to `drawn_lines` as it finishes.
+
+    The LINE_PAUSE_MS beat between lines is counted down inside the same loop, and
+    a frame is only presented when a character appears or the face changes.
+    """
+    queue = [(ln or "") for ln in lines]
+    if not queue:
+        return
+    li = 0
+    target = queue[0]
+    prefix_surfs = _prefix_surfaces(target)
+    face_key = (draw_face_style, glitch)
+    backdrop = _typing_backdrop(drawn_lines, x, base_y, line_spacing, face_key)
+    face_blink = None
     shown = 0
-    timer_ms = 0.0
-    while shown < len(target):
-        dt = clock.tick(60) / 1000.0
-        timer_ms += dt * 1000.0
+    timer_ms = 0
+    pause_ms = LINE_PAUSE_MS if not target else 0
+    dirty = True
+    last_ms = pygame.time.get_ticks()
+    while True:
+        now_ms = pygame.time.get_ticks()
+        dt_ms = now_ms - last_ms
+        last_ms = now_ms
+
+        if pause_ms > 0:
+            pause_ms -= dt_ms
+            if pause_ms <= 0:
+                drawn_lines.append(target)
+                li += 1
+                if li >= len(queue):
+                    return
+                target = queue[li]
+                prefix_surfs = _prefix_surfaces(target)
+                backdrop = _typing_backdrop(drawn_lines, x, base_y, line_spacing, face_key)
+                shown = 0
+                timer_ms = 0
+                if not target:
+                    pause_ms = LINE_PAUSE_MS
+        else:
+            timer_ms += dt_ms
+            if timer_ms >= TYPE_CHAR_MS:
+                # Reveal everything that's due in one draw (catches up after a slow frame)
+                k = min(timer_ms // TYPE_CHAR_MS, len(target) - shown)
+                timer_ms -= k * TYPE_CHAR_MS
+                shown += k
+                dirty = True
+                if play_key_sound:
+                    _play_keyclick(target[shown - 1])
+                if shown >= len(target):
+                    pause_ms = LINE_PAUSE_MS
+
+        events()
+
+        # Steady face lives on the backdrop (redrawn on blink); a glitching one jitters per frame
+        if draw_face_style and not glitch and _update_face_blink() != face_blink:
+            face_blink = _is_blinking
+            draw_face(draw_face_style, surface=backdrop)
+            dirty = True
+        if draw_face_style and glitch:
+            dirty = True
+        if dirty:
+            dirty = False
+            screen.blit(backdrop, (0, 0))
+            if draw_face_style and glitch:
+                draw_face(draw_face_style, glitch=True)
+            if shown:
+                screen.blit(prefix_surfs[shown - 1], (x, base_y + len(drawn_lines) * line_spacing))
+            present()
 
-        if timer_ms >= TYPE_CHAR_MS:
-            timer_ms -= TYPE_CHAR_MS
-            just = (target[shown] if shown < len(target) else "")
-            shown += 1
-            if just and play_key_sound:
-                _play_keyclick(just)
+        # Sleep until the next character (or the end of the line pause) is due
+        due = pause_ms if pause_ms > 0 else TYPE_CHAR_MS - timer_ms
+        if draw_face_style and glitch:
+            due = min(due, 16)  # keep the jitter animating
+        pygame.time.delay(max(1, int(due)))
 
-        for _event in events():
-            pass
 
-        screen.fill(BG)
-        if draw_face_style:
-            draw_face(draw_face_style, glitch=glitch)
+def type_out_line_letterwise(
+    line,
+    drawn_lines,
+    x,
+    base_y,
+    line_spacing,
+    draw_face_style="smile",
+    glitch=False,
+    play_key_sound=True,
+):
+    # Single-line form; the caller appends the line to drawn_lines itself
+    type_out_lines_letterwise(
+        [line], list(drawn_lines), x, base_y, line_spacing,
+        draw_face_style=draw_face_style, glitch=glitch, play_key_sound=play_key_sound,
+    )
 
-        for i, ln in enumerate(drawn_lines):
-            s = font.render(ln, True, TEXT)
-            screen.blit(s, (x, base_y + i * line_spacing))
 
-        s = font.render(target[:shown], True, TEXT)
-        screen.blit(s, (x, base_y + len(drawn_lines) * line_spacing))
-        present()
+def _ellipsis_schedule(target):
+    """Per-character timing for a line: (char_ms, pause_after_ms, ends_run).
 
-    soft_wait(LINE_PAUSE_MS)
+    Dots inside a run of 3+ slow down and pause progressively; the last dot of
+    the run gets the longer ELLIPSIS_AFTER_PAUSE_MS beat.
+    """
+    n = len(target)
+    char_ms = [TYPE_CHAR_MS] * n
+    pause_ms = [0] * n
+    ends_run = [False] * n
+    i = 0
+    while i < n:
+        if target[i] != ".":
+            i += 1
+            continue
+        k = i
+        while k < n and target[k] == ".":
+            k += 1
+        if k - i >= 3:
+            for pos in range(k - i):
+                ramp = 1.0 + ELLIPSIS_RAMP * pos
+                char_ms[i + pos] = int(ELLIPSIS_CHAR_MS * ramp)
+                pause_ms[i + pos] = int(ELLIPSIS_DOT_PAUSE_MS * ramp)
+            ends_run[k - 1] = True
+        i = k
+    return char_ms, pause_ms, ends_run
 
 
 def type_out_line_letterwise_thoughtful(
     line, drawn_lines, x, base_y, line_spacing, draw_face_style="smile", glitch=False
 ):
     target = (line or "")
+    prefix_surfs = _prefix_surfaces(target)
+    char_ms, pause_ms, ends_run = _ellipsis_schedule(target)
+    backdrop = _typing_backdrop(drawn_lines, x, base_y, line_spacing, (draw_face_style, glitch))
+    face_blink = None
     shown = 0
-    timer_ms = 0.0
+    timer_ms = 0
     ellipsis_pause_ms = 0
     ellipsis_after_run = False
+    dirty = True
+    last_ms = pygame.time.get_ticks()
 
     while shown < len(target):
-        if target[shown] == ".":
-            j = shown
-            while j > 0 and target[j - 1] == ".":
-                j -= 1
-            k = shown
-            while k < len(target) and target[k] == ".":
-                k += 1
-            run_len = k - j
-            if run_len >= 3:
-                pos_in_run = shown - j
-                per_char_ms = int(ELLIPSIS_CHAR_MS * (1.0 + ELLIPSIS_RAMP * pos_in_run))
-            else:
-                per_char_ms = TYPE_CHAR_MS
-        else:
-            per_char_ms = TYPE_CHAR_MS
+        per_char_ms = char_ms[shown]
 
-        dt = clock.tick(60) / 1000.0
-        timer_ms += dt * 1000.0
-        just_revealed_char = None
+        now_ms = pygame.time.get_ticks()
+        timer_ms += now_ms - last_ms
+        last_ms = now_ms
 
         if timer_ms >= per_char_ms:
             timer_ms -= per_char_ms
             just_revealed_char = target[shown]
             shown += 1
+            dirty = True
             if just_revealed_char:
                 _play_keyclick(just_revealed_char)
 
-            if just_revealed_char == ".":
-                idx = shown - 1
-                j = idx
-                while j > 0 and target[j - 1] == ".":
-                    j -= 1
-                k = idx + 1
-                while k < len(target) and k < len(target) and target[k] == ".":
-                    k += 1
-                run_len = k - j
-                if run_len >= 3:
-                    pos_in_run = idx - j
-                    ramp = 1.0 + ELLIPSIS_RAMP * pos_in_run
-                    ellipsis_pause_ms = int(ELLIPSIS_DOT_PAUSE_MS * ramp)
-                    ellipsis_after_run = idx + 1 == k
-                else:
-                    ellipsis_pause_ms = 0
-                    ellipsis_after_run = False
-            else:
+            ellipsis_pause_ms = pause_ms[shown - 1]
+            ellipsis_after_run = ends_run[shown - 1]
+
+        events()
+
+        # Steady face lives on the backdrop (redrawn on blink); a glitching one jitters per frame
+        if draw_face_style and not glitch and _update_face_blink() != face_blink:
+            face_blink = _is_blinking
+            draw_face(draw_face_style, surface=backdrop)
+            dirty = True
+        if draw_face_style and glitch:
+            dirty = True
+        if dirty:
+            dirty = False
+            screen.blit(backdrop, (0, 0))
+            if draw_face_style and glitch:
+                draw_face(draw_face_style, glitch=True)
+            if shown:
+                screen.blit(prefix_surfs[shown - 1], (x, base_y + len(drawn_lines) * line_spacing))
+            present()
+
+        if ellipsis_pause_ms or ellipsis_after_run:
+            if ellipsis_pause_ms:
+                soft_wait(ellipsis_pause_ms)
                 ellipsis_pause_ms = 0
+            if ellipsis_after_run:
+                soft_wait(ELLIPSIS_AFTER_PAUSE_MS)
                 ellipsis_after_run = False
+            last_ms = pygame.time.get_ticks()  # the pause itself doesn't count towards the next char
 
-        for _event in events():
-            pass
+        # Sleep until the next character is due
+        if shown < len(target):
+            due = char_ms[shown] - timer_ms
+            if draw_face_style and glitch:
+                due = min(due, 16)  # keep the jitter animating
+            pygame.time.delay(max(1, int(due)))
 
-        screen.fill(BG)
-        if draw_face_style:
-            draw_face(draw_face_style, glitch=glitch)
+    soft_wait(LINE_PAUSE_MS)
 
-        for i, ln in enumerate(drawn_lines):
-            s = font.render(ln, True, TEXT)
-            screen.blit(s, (x, base_y + i * line_spacing))
 
-        s = font.render(target[:shown], True, TEXT)
-        screen.blit(s, (x, base_y + len(drawn_lines) * line_spacing))
-        present()
+# ====== Text utils ======
+# Advance widths of the ASCII range; the DOS font has no kerning, so a string's
+# width is just the sum of its glyphs (anything else falls back to font.size)
+_CHAR_W = [font.size(chr(i))[0] for i in range(128)]
 
-        if ellipsis_pause_ms:
-            soft_wait(ellipsis_pause_ms)
-            ellipsis_pause_ms = 0
-        if ellipsis_after_run:
-            soft_wait(ELLIPSIS_AFTER_PAUSE_MS)
-            ellipsis_after_run = False
 
-    soft_wait(LINE_PAUSE_MS)
+def swidth(s):
+    return sum(_CHAR_W[o] if o < 128 else font.size(chr(o))[0] for o in map(ord, s))
+
+
+# LRU like the render cache: the dialogue wraps lines with visitors' names in them,
+# so an unbounded dict would grow for the whole run of the installation
+_WRAP_CACHE = OrderedDict()
+_WRAP_CACHE_MAX = 256
 
 
-# ====== Text utils ======
 def wrap_text_to_width(text, max_width):
-    words = text.split(" ")
-    lines, current = [], ""
-    for w in words:
-        test = current + (" " if current else "") + w
-        if font.size(test)[0] <= max_width:
-            current = test
+    key = (text, max_width)
+    cached = _WRAP_CACHE.get(key)
+    if cached is not None:
+        _WRAP_CACHE.move_to_end(key)
+        return list(cached)
+    # Running line width from cached word widths (the DOS font has no kerning)
+    space_w = _CHAR_W[32]
+    lines, current, current_w = [], "", 0
+    for w in text.split(" "):
+        ww = swidth(w)
+        test_w = current_w + (space_w if current else 0) + ww
+        if test_w <= max_width:
+            current = current + (" " if current else "") + w
+            current_w = test_w
         else:
             if current:
                 lines.append(current)
-            current = w
+            current, current_w = w, ww
     if current:
         lines.append(current)
+    _WRAP_CACHE[key] = tuple(lines)
+    if len(_WRAP_CACHE) > _WRAP_CACHE_MAX:
+        _WRAP_CACHE.popitem(last=False)
     return lines
 
 
 # ====== Boot typing (init screen) ======
+_BOOT_RNG = np.random.default_rng()
+_BOOT_PAUSE_SHORT = np.array([ord(c) for c in ",;:"], dtype=np.uint32)
+_BOOT_PAUSE_LONG = np.array([ord(c) for c in ".!?)]}"], dtype=np.uint32)
+
+
 def _boot_delays_for(text: str, base_cps: float = 22.0, jitter: float = 0.50):
     base_cps = max(4.0, float(base_cps))
     base_delay = 1.0 / base_cps
-    delays, i = [], 0
-    while i < len(text):
-        ch = text[i]
-        d = base_delay * random.uniform(1.0 - jitter, 1.0 + jitter)
-        if text[i : i + 3] == "...":
-            delays.extend([d, d, d + base_delay * 3.5])
-            i += 3
-            if random.random() < 1 / 15:
-                delays[-1] += base_delay * random.uniform(2.0, 4.0)
-            continue
-        if ch in ",;:":
-            d += base_delay * 1.5
-        elif ch in ".!?)]}":
-            d += base_delay * 2.5
-        elif ch == "\t":
-            d += base_delay * 2.0
-        if random.random() < 1 / 18:
-            d *= 0.4
-        delays.append(d)
-        i += 1
-        if random.random() < 1 / 60:
-            delays[-1] += base_delay * random.uniform(2.0, 4.0)
-    return delays
+    if not text:
+        return np.empty(0)
+    # One code point per element, so every rule below is a whole-array op
+    codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+    n = codes.size
+    rng = _BOOT_RNG
+    jit = base_delay * rng.uniform(1.0 - jitter, 1.0 + jitter, n)
+    d = jit + base_delay * (1.5 * np.isin(codes, _BOOT_PAUSE_SHORT)
+                            + 2.5 * np.isin(codes, _BOOT_PAUSE_LONG)
+                            + 2.0 * (codes == 9))
+    d[rng.random(n) < 1 / 18] *= 0.4
+    hitch = rng.random(n) < 1 / 60
+    d[hitch] += base_delay * rng.uniform(2.0, 4.0, int(hitch.sum()))
+    # "..." types as three even beats and a long pause (few per line, so a plain scan)
+    i = text.find("...")
+    while i != -1:
+        d[i:i + 3] = jit[i]
+        d[i + 2] += base_delay * 3.5
+        if rng.random() < 1 / 15:
+            d[i + 2] += base_delay * rng.uniform(2.0, 4.0)
+        i = text.find("...", i + 3)
+    return d
+
+
+def _boot_schedule_for(delays, start):
+    """Absolute due time of each keystroke: the first at start, each later one after the delays before it."""
+    if len(delays) == 0:
+        return []
+    due = np.empty(len(delays))
+    due[0] = 0.0
+    np.cumsum(delays[:-1], out=due[1:])
+    return (due + start).tolist()  # plain floats for the per-frame compares
 
 
 def typewriter_boot_screen(
@@ -796,17 +1293,33 @@ def typewriter_boot_screen(
 ):
     local_clock = pygame.time.Clock()
     blink = True
-    last_blink = pygame.time.get_ticks()
+    last_blink = time.perf_counter()  # one clock (seconds) for typing and blink
+    blink_s = BLINK_INTERVAL_MS / 1000.0
 
     if start_y is None:
         total_h_est = len(lines) * (font_obj.get_height() + line_spacing_px)
         start_y = max(24, (screen.get_height() - total_h_est) // 2 - font_obj.get_height())
 
-    schedules = [_boot_delays_for(s, base_cps=base_cps, jitter=jitter) for s in lines]
+    # One vectorised pass over the whole screen, then one cumulative schedule for every
+    # keystroke; the "\n" joins are dropped so each line follows straight on from the last
+    text = "\n".join(lines)
+    delays = _boot_delays_for(text, base_cps=base_cps, jitter=jitter)
+    delays = delays[np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32) != 10]
+    flat = _boot_schedule_for(delays, time.perf_counter())
+    schedules, at = [], 0
+    for s in lines:
+        schedules.append(flat[at:at + len(s)])
+        at += len(s)
     typed = ["" for _ in lines]
     line_idx = 0
     char_i = 0
-    t_next = time.perf_counter()
+    step_y = font_obj.get_height() + line_spacing_px
+    caret_x = start_x + 6  # measured once per typed char, not per frame
+    live_surf = None  # the line being typed, re-rendered only when it grows
+
+    # Finished lines are stamped onto this once; each frame is one blit plus the live line
+    done_bg = pygame.Surface(screen.get_size()).convert()
+    done_bg.fill(bg)
 
     typing = True
     while typing:
@@ -815,36 +1328,41 @@ def typewriter_boot_screen(
             if ev.type == pygame.KEYDOWN and allow_skip_with_key:
                 if ev.key in (pygame.K_RETURN, pygame.K_SPACE, pygame.K_ESCAPE):
                     typed = lines[:]
+                    caret_x = start_x + font_obj.size(lines[-1])[0] + 6
+                    for i in range(line_idx, len(lines)):
+                        done_bg.blit(render_cached(lines[i], fg, font_obj), (start_x, start_y + i * step_y))
                     line_idx = len(lines)
                     char_i = 0
                     typing = False
 
         if line_idx < len(lines):
-            delays = schedules[line_idx]
-            if char_i < len(lines[line_idx]) and now >= t_next:
-                typed[line_idx] = lines[line_idx][:char_i + 1]
-                t_next = now + delays[char_i]
-                char_i += 1
-            if char_i >= len(lines[line_idx]):
+            due = schedules[line_idx]
+            n = len(due)
+            if char_i < n and now >= due[char_i]:
+                while char_i < n and now >= due[char_i]:
+                    char_i += 1
+                typed[line_idx] = lines[line_idx][:char_i]
+                live_surf = font_obj.render(typed[line_idx], True, fg)
+                caret_x = start_x + live_surf.get_width() + 6
+            if char_i >= n:
+                done_bg.blit(render_cached(typed[line_idx], fg, font_obj), (start_x, start_y + line_idx * step_y))
                 char_i = 0
                 line_idx += 1
+                live_surf = None
+                if line_idx < len(lines):
+                    caret_x = start_x + 6
 
-        if pygame.time.get_ticks() - last_blink > BLINK_INTERVAL_MS:
+        if now - last_blink > blink_s:
             blink = not blink
-            last_blink = pygame.time.get_ticks()
+            last_blink = now
 
-        screen.fill(bg)
-        y = start_y
-        for s in typed:
-            surf = font_obj.render(s, True, fg)
-            screen.blit(surf, (start_x, y))
-            y += font_obj.get_height() + line_spacing_px
+        screen.blit(done_bg, (0, 0))
+        if live_surf is not None and line_idx < len(lines):
+            screen.blit(live_surf, (start_x, start_y + line_idx * step_y))
 
         caret_line_idx = min(line_idx, len(lines) - 1)
-        last_text = typed[caret_line_idx]
         if blink:
-            caret_x = start_x + font_obj.size(last_text)[0] + 6
-            caret_y = start_y + caret_line_idx * (font_obj.get_height() + line_spacing_px) + font_obj.get_height()
+            caret_y = start_y + caret_line_idx * step_y + font_obj.get_height()
             draw_caret(screen, caret_x, caret_y, font_obj)
 
         present()
@@ -859,21 +1377,15 @@ def typewriter_boot_screen(
             if ev.type == pygame.KEYDOWN and ev.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
                 waiting = False
 
-        if pygame.time.get_ticks() - last_blink > BLINK_INTERVAL_MS:
+        now = time.perf_counter()
+        if now - last_blink > blink_s:
             blink = not blink
-            last_blink = pygame.time.get_ticks()
+            last_blink = now
 
-        screen.fill(bg)
-        y = start_y
-        for s in typed:
-            surf = font_obj.render(s, True, fg)
-            screen.blit(surf, (start_x, y))
-            y += font_obj.get_height() + line_spacing_px
+        screen.blit(done_bg, (0, 0))
 
         if typed and blink:
-            last_line = typed[-1]
-            caret_x = start_x + font_obj.size(last_line)[0] + 6
-            caret_y = start_y + (len(typed) - 1) * (font_obj.get_height() + line_spacing_px) + font_obj.get_height()
+            caret_y = start_y + (len(typed) - 1) * step_y + font_obj.get_height()
             draw_caret(screen, caret_x, caret_y, font_obj)
 
         present()
@@ -915,75 +1427,76 @@ def init_screen():
     start_y = base_target_y - (len(boot_lines) - 1) * LINE_PITCH
 
     blink = True
-    last_blink = pygame.time.get_ticks()
+    last_blink = time.perf_counter()  # one clock (seconds) for typing and blink
+    blink_s = BLINK_INTERVAL_MS / 1000.0
     typed = []
+    # The log accumulates one glyph per keystroke; frames just copy it to the screen
+    log_surface = pygame.Surface((WIDTH, HEIGHT)).convert()
+    log_surface.fill(BG)
 
     for line in boot_lines:
-        cur = ""
-        next_t = time.perf_counter()
-
-        while len(cur) < len(line):
-            for _ev in events():
-                pass
+        x_cursor = start_x
+        cy = start_y + len(typed) * LINE_PITCH
+        # Whole line's keystroke times up front (delay after each char, punctuation and
+        # the third dot of "..." linger); the frame loop only compares against them
+        codes = np.frombuffer(line.encode("utf-32-le"), dtype=np.uint32)
+        steps = BASE_DT * _BOOT_RNG.uniform(1.0 - JITTER, 1.0 + JITTER, codes.size)
+        steps += BASE_DT * (1.2 * np.isin(codes, _BOOT_PAUSE_SHORT) + 2.0 * np.isin(codes, _BOOT_PAUSE_LONG))
+        dots = codes == 46
+        steps[2:] += BASE_DT * 1.5 * (dots[2:] & dots[1:-1] & dots[:-2])
+        due = _boot_schedule_for(steps, time.perf_counter())
+        k, n = 0, len(line)
+
+        while k < n:
+            events()
 
             now = time.perf_counter()
-            if now >= next_t:
-                ch = line[len(cur)]
-                cur += ch
-                step = BASE_DT * random.uniform(1.0 - JITTER, 1.0 + JITTER)
-                if ch in ",;:":
-                    step += BASE_DT * 1.2
-                elif ch in ".!?)]}":
-                    step += BASE_DT * 2.0
-                if len(cur) >= 3 and cur[-3:] == "...":
-                    step += BASE_DT * 1.5
-                next_t = now + step
-
-            if pygame.time.get_ticks() - last_blink > BLINK_INTERVAL_MS:
+            while k < n and now >= due[k]:
+                glyph = render_cached(line[k], font_obj=boot_font)
+                log_surface.blit(glyph, (x_cursor, cy))
+                x_cursor += glyph.get_width()
+                k += 1
+
+            if now - last_blink > blink_s:
                 blink = not blink
-                last_blink = pygame.time.get_ticks()
+                last_blink = now
 
-            screen.fill(BG)
-            for i, done in enumerate(typed):
-                s = boot_font.render(done, True, TEXT)
-                screen.blit(s, (start_x, start_y + i * LINE_PITCH))
-            s = boot_font.render(cur, True, TEXT)
-            cy = start_y + len(typed) * LINE_PITCH
-            screen.blit(s, (start_x, cy))
+            screen.blit(log_surface, (0, 0))
 
             if blink:
-                caret_x = start_x + boot_font.size(cur)[0] + 6
+                caret_x = x_cursor + 6
                 caret_y = cy + boot_font.get_height()
                 draw_caret(screen, caret_x, caret_y, boot_font)
 
             present()
             clock.tick(60)
 
-        typed.append(cur)
+        typed.append(line)
         soft_wait(LINE_PAUSE_MS)
 
+    need_redraw = True
     while True:
         for ev in events():
             if ev.type == pygame.KEYDOWN and ev.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
                 wait_for_enter_release()
                 return
 
-        if pygame.time.get_ticks() - last_blink > BLINK_INTERVAL_MS:
+        now = time.perf_counter()
+        if now - last_blink > blink_s:
             blink = not blink
-            last_blink = pygame.time.get_ticks()
+            last_blink = now
+            need_redraw = True
 
-        screen.fill(BG)
-        for i, done in enumerate(typed):
-            s = boot_font.render(done, True, TEXT)
-            screen.blit(s, (start_x, start_y + i * LINE_PITCH))
+        if need_redraw:
+            need_redraw = False
+            screen.blit(log_surface, (0, 0))
 
-        if typed and blink:
-            last_line = typed[-1]
-            caret_x = start_x + boot_font.size(last_line)[0] + 6
-            caret_y = start_y + (len(typed) - 1) * LINE_PITCH + boot_font.get_height()
-            draw_caret(screen, caret_x, caret_y, boot_font)
+            if typed and blink:
+                caret_x = x_cursor + 6
+                caret_y = start_y + (len(typed) - 1) * LINE_PITCH + boot_font.get_height()
+                draw_caret(screen, caret_x, caret_y, boot_font)
 
-        present()
+            present()
         clock.tick(60)
 
 
@@ -998,8 +1511,7 @@ def wait_for_enter(message="press enter to begin.", show_face=False):
             if not _music_ready:
                 if not _load_title_music():
                     raise RuntimeError("Startup music not available (see earlier error).")
-            pygame.mixer.music.set_volume(0.15)
-            pygame.mixer.music.play(loops=-1, fade_ms=2500)
+            title_music_play(0.15, fade_ms=2500)
             lights_fade_up()
             title_music_started = True
         except Exception as e:
@@ -1008,35 +1520,44 @@ def wait_for_enter(message="press enter to begin.", show_face=False):
                 print("[HINT] If this is a codec issue, prefer WAV/OGG inside assets/music/")
                 wait_for_enter._warned = True
     blink = True
-    last = pygame.time.get_ticks()
+    lines = wrap_text_to_width(message, WIDTH - 100)
+    base_y = HEIGHT - 120
+    w = swidth(lines[-1])
+    # Recompose only when the face blinks; caret toggles restore the clean frame
+    need_compose = True
+    need_redraw = False
+    face_blink = None
     while True:
-        screen.fill(BG)
-        if show_face:
-            draw_face("smile")
-        lines = wrap_text_to_width(message, WIDTH - 100)
-        base_y = HEIGHT - 120
-        for i, line in enumerate(lines):
-            surf = font.render(line, True, TEXT)
-            screen.blit(surf, (50, base_y + i * 32))
-        last_line = lines[-1]
-        w = font.size(last_line)[0]
-        if blink:
-            draw_caret(screen, 50 + w + 6, base_y + (len(lines) - 1) * 32 + font.get_height(), font)
+        if show_face and _update_face_blink() != face_blink:
+            face_blink = _is_blinking
+            need_compose = True
+        if need_compose:
+            need_compose = False
+            screen.fill(BG)
+            if show_face:
+                draw_face("smile")
+            for i, line in enumerate(lines):
+                surf = render_cached(line)
+                screen.blit(surf, (50, base_y + i * 32))
+            _CLEAN_FRAME.blit(screen, (0, 0))
+            need_redraw = True
+        if need_redraw:
+            need_redraw = False
+            present_caret_blink(blink, 50 + w + 6, base_y + (len(lines) - 1) * 32 + font.get_height(), font)
 
-        present()
         for event in events():
             if event.type == pygame.KEYDOWN and event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
                 try:
-                    pygame.mixer.music.fadeout(TITLE_FADE_MS)
+                    title_music_fadeout(TITLE_FADE_MS)
                 except Exception:
                     pass
                 lights_fade_down()
                 title_fade_out()
                 title_music_started = False
                 return
-        if pygame.time.get_ticks() - last > BLINK_INTERVAL_MS:
+        if _blink_now() != blink:
             blink = not blink
-            last = pygame.time.get_ticks()
+            need_redraw = True
         clock.tick(60)
 
 
@@ -1054,28 +1575,37 @@ def input_name_screen():
     line_spacing = 32
     prompt_lines = wrap_text_to_width(instructions, WIDTH - 100)
     typed_prompt = []
-    for ln in prompt_lines:
-        type_out_line_letterwise(ln, typed_prompt, x, prompt_base_y, line_spacing, draw_face_style=None)
-        typed_prompt.append(ln)
+    type_out_lines_letterwise(prompt_lines, typed_prompt, x, prompt_base_y, line_spacing, draw_face_style=None)
     blink = True
-    last = pygame.time.get_ticks()
+    # The name is rendered (uncached: every prefix is a one-off) and the page composed
+    # only when it changes; caret toggles restore the clean frame
+    name_w = 0
+    need_compose = True
+    need_redraw = False
     while True:
-        screen.fill(BG)
-        for i, line in enumerate(typed_prompt):
-            s = font.render(line, True, TEXT)
-            screen.blit(s, (x, prompt_base_y + i * line_spacing))
-        s = font.render(name, True, TEXT)
-        screen.blit(s, (50, HEIGHT - 160))
-        if blink:
-            draw_caret(screen, 50 + s.get_width() + 6, HEIGHT - 160 + font.get_height(), font)
+        if need_compose:
+            need_compose = False
+            screen.fill(BG)
+            for i, line in enumerate(typed_prompt):
+                s = render_cached(line)
+                screen.blit(s, (x, prompt_base_y + i * line_spacing))
+            name_surf = font.render(name, True, TEXT)
+            name_w = name_surf.get_width()
+            screen.blit(name_surf, (50, HEIGHT - 160))
+            _CLEAN_FRAME.blit(screen, (0, 0))
+            need_redraw = True
+        if need_redraw:
+            need_redraw = False
+            present_caret_blink(blink, 50 + name_w + 6, HEIGHT - 160 + font.get_height(), font)
 
-        present()
         for event in events():
             if event.type == pygame.KEYDOWN:
                 if event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
                     return (name.strip() or "FRIEND")
                 elif event.key == pygame.K_BACKSPACE:
-                    name = name[:-1]
+                    if name:
+                        name = name[:-1]
+                        need_compose = True
                 elif event.key == pygame.K_ESCAPE:
                     return "FRIEND"
                 else:
@@ -1084,9 +1614,10 @@ def input_name_screen():
                         ch = ch.upper()
                         if 32 <= ord(ch) <= 126 and len(name) < 20:
                             name += ch
-        if pygame.time.get_ticks() - last > BLINK_INTERVAL_MS:
+                            need_compose = True
+        if _blink_now() != blink:
             blink = not blink
-            last = pygame.time.get_ticks()
+            need_redraw = True
         clock.tick(60)
 
 
@@ -1102,7 +1633,6 @@ def show_text_block(
     base_y = HEIGHT - 180
     line_spacing = 32
     lines = []
-    lines = []
     for para in (text or "").split("\n"):
         if para == "":
             # preserve explicit blank lines (extra vertical space)
@@ -1113,46 +1643,52 @@ def show_text_block(
         lines = [""]
 
     typed = []
-    for line in lines:
-        type_out_line_letterwise(
-            line,
-            typed,
-            x,
-            base_y,
-            line_spacing,
-            draw_face_style=face_style,
-            glitch=glitch,
-            play_key_sound=play_key_sound,
-        )
-        typed.append(line)
+    type_out_lines_letterwise(
+        lines,
+        typed,
+        x,
+        base_y,
+        line_spacing,
+        draw_face_style=face_style,
+        glitch=glitch,
+        play_key_sound=play_key_sound,
+    )
 
     blink = True
-    last = pygame.time.get_ticks()
-    last_line_w = font.size(typed[-1])[0]
+    last_line_w = swidth(typed[-1])
+    block = render_block_cached(typed, line_spacing)
+    # Glitching faces jitter every frame; otherwise recompose only on a face blink
+    # and let caret toggles restore the clean frame
+    need_compose = True
+    need_redraw = False
+    face_blink = None
     while True:
         for event in events():
             if event.type == pygame.KEYDOWN and event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
                 return
 
-        screen.fill(BG)
-        if face_style:
-            draw_face(face_style, glitch=glitch)
-        for i, line in enumerate(typed):
-            s = font.render(line, True, TEXT)
-            screen.blit(s, (x, base_y + i * line_spacing))
-
-        if blink:
-            draw_caret(
-                screen,
+        if face_style and _update_face_blink() != face_blink:
+            face_blink = _is_blinking
+            need_compose = True
+        if need_compose or (face_style and glitch):
+            need_compose = False
+            screen.fill(BG)
+            if face_style:
+                draw_face(face_style, glitch=glitch)
+            screen.blit(block, (x, base_y))
+            _CLEAN_FRAME.blit(screen, (0, 0))
+            need_redraw = True
+        if need_redraw:
+            need_redraw = False
+            present_caret_blink(
+                blink,
                 x + last_line_w + 6,
                 base_y + (len(typed) - 1) * line_spacing + font.get_height(),
                 font,
             )
-
-        present()
-        if pygame.time.get_ticks() - last > BLINK_INTERVAL_MS:
+        if _blink_now() != blink:
             blink = not blink
-            last = pygame.time.get_ticks()
+            need_redraw = True
         clock.tick(60)
 
 
@@ -1166,6 +1702,14 @@ def overload_questions_screen(duration_s=20.0):
     line_spacing = 32
     bottom_limit = HEIGHT - 40
     rows_visible = max(1, (bottom_limit - base_y) // line_spacing)
+    # Row positions only depend on the index (lines past the bottom wrap to the top)
+    row_ys = []
+    y = base_y
+    for _ in range(rows_visible * 4):
+        row_ys.append(y)
+        y += line_spacing
+        if y + font.get_height() > bottom_limit:
+            y = 40
 
     bank = [
         "is it big?","is it small?","does it destroy?","does it create?","is it good?",
@@ -1178,29 +1722,42 @@ def overload_questions_screen(duration_s=20.0):
         "is it light?","is it void?"
     ]
 
+    # Every question rendered up front (through the shared cache, so later participants
+    # reuse them); the live line is a clipped view of its question, not a fresh render
+    bank_surfs = [render_cached(q) for q in bank]
+
     def corrupt_text(s: str, p=0.15):
         table = "~^#*$%/\\|+=-"
+        k = len(table)
+        scale = k / p if p > 0 else 0.0
+        rnd = random.random
         out = []
         for ch in s:
-            if ch == " ":
-                out.append(ch)
-            elif random.random() < p:
-                out.append(random.choice(table))
-            else:
-                out.append(ch)
+            # one draw per char: r < p corrupts, and r/p (uniform again) picks the glyph
+            r = rnd()
+            out.append(table[int(r * scale) % k] if r < p and ch != " " else ch)
         return "".join(out)
 
     start_t = time.perf_counter()
     end_t   = start_t + max(2.0, float(duration_s))
     idx = 0
     lines_buffer = []
+    # Rendered once as each line is committed; kept out of the LRU because corrupted
+    # lines are one-offs that would only evict the reusable entries
+    lines_surfs = []
+
+    def commit_line(ln, surf=None):
+        lines_buffer.append(ln)
+        lines_surfs.append(surf or font.render(ln, True, TEXT).convert_alpha())
 
+    next_t = start_t  # when the next line's first char is due
     while time.perf_counter() < end_t:
         # consume events but IGNORE Enter during overload
-        for _ in events():
-            pass
+        events()
 
         q = bank[idx]
+        q_surf = bank_surfs[idx]
+        q_h = q_surf.get_height()
         idx = (idx + 1) % len(bank)
 
         # ramp corruption & speed over time
@@ -1213,74 +1770,65 @@ def overload_questions_screen(duration_s=20.0):
 
         shown_len = 0
         q_len = len(q)
-
-        # per-char loop with tight guard to avoid IndexError
-        while shown_len < q_len and time.perf_counter() < end_t:
-            for _ in events():
-                pass  # still ignore keys
-
-            # guard: if shown_len >= q_len, bail
-            if shown_len >= q_len:
+        # reveal schedule for the whole line: char k is due after the jittered gaps before it
+        gaps = _BOOT_RNG.uniform(0.7, 1.25, q_len) * per_char
+        ends = np.cumsum(gaps)
+        due = (next_t + ends - gaps).tolist()
+        next_t += float(ends[-1])
+
+        # one tick per frame: reveal whatever is due, then draw once
+        while shown_len < q_len:
+            now = time.perf_counter()
+            if now >= end_t:
                 break
+            prev = shown_len
+            while shown_len < q_len and now >= due[shown_len]:
+                _play_keyclick(q[shown_len])
+                shown_len += 1
 
-            ch = q[shown_len]
-            shown_len += 1
-            _play_keyclick(ch)
-
-            # draw frame
-            screen.fill(BG)
-            draw_face("smile", glitch=face_glitch)
+            if shown_len != prev:
+                screen.fill(BG)
+                draw_face("smile", glitch=face_glitch)
 
-            recent = (lines_buffer + [q[:shown_len]])[-(rows_visible+1):]
-            y = base_y
-            for ln in recent:
-                s = font.render(ln, True, TEXT)
+                recent = lines_surfs[-rows_visible:]
+                recent.append(q_surf.subsurface((0, 0, min(q_surf.get_width(), swidth(q[:shown_len])), q_h)))
                 if face_glitch:
-                    screen.blit(s, (x + random.randint(-1,1), y + random.randint(-1,1)))
+                    screen.blits([(s, (x + random.randint(-1,1), y + random.randint(-1,1)))
+                                  for s, y in zip(recent, row_ys)], doreturn=False)
                 else:
-                    screen.blit(s, (x, y))
-                y += line_spacing
-                if y + font.get_height() > bottom_limit:
-                    y = 40  # wrap to top
-            present()
+                    screen.blits([(s, (x, y)) for s, y in zip(recent, row_ys)], doreturn=False)
+                present()
 
-            time.sleep(per_char * random.uniform(0.7, 1.25))
+            clock.tick(60)
+            events()  # still ignore keys
 
         # commit finished (possibly corrupted) line
         final_line = corrupt_text(q, corr_p) if corr_p > 0 else q
         if corr_p > 0.25 and lines_buffer and random.random() < 0.08:
             echo = corrupt_text(random.choice(lines_buffer[-min(8, len(lines_buffer)):]), corr_p)
-            lines_buffer.append(echo)
-        lines_buffer.append(final_line)
+            commit_line(echo)
+        commit_line(final_line, q_surf if final_line == q else None)
 
-        # quick redraw burst late in the sequence
+        # quick redraw burst late in the sequence: hold the next line back a beat
         if t01 > 0.7 and random.random() < 0.2:
-            time.sleep(0.02)
+            next_t += 0.02
+        # never schedule into the past if a frame ran long
+        next_t = max(next_t, time.perf_counter())
 
     # tiny glitch burst, then hard blackout → return
     for _ in range(14):
-        for _ in events():
-            pass
+        events()
         screen.fill(BG)
         draw_face("smile", glitch=True)
-        y = base_y
-        for ln in lines_buffer[-(rows_visible*4):]:
-            s = font.render(ln, True, TEXT)
-            screen.blit(s, (x + random.randint(-3,3), y + random.randint(-3,3)))
-            y += line_spacing
-            if y + font.get_height() > bottom_limit:
-                y = 40
+        screen.blits([(s, (x + random.randint(-3,3), y + random.randint(-3,3)))
+                      for s, y in zip(lines_surfs[-(rows_visible*4):], row_ys)], doreturn=False)
         present()
-        time.sleep(0.02)
+        clock.tick(50)
 
-    # blackout hold
-    until = pygame.time.get_ticks() + 500
-    while pygame.time.get_ticks() < until:
-        for _ in events():
-            pass
-        screen.fill((0, 0, 0))
-        present()
-        clock.tick(240)
+    # blackout hold (the frame doesn't change, so show it once and sleep)
+    screen.fill((0, 0, 0))
+    present()
+    soft_wait(500)
 
 
 # ====== Recalibrating screen (chunked drama + footer prompt) ======
@@ -1300,6 +1848,12 @@ def recalibrating_screen():
     bar_h = 36
     bar_x = (WIDTH - bar_w) // 2
     bar_y = HEIGHT // 2
+    # Bar pieces drawn once; each chunk blits the outline and a clipped slice of the fill
+    bar_outline = pygame.Surface((bar_w, bar_h), pygame.SRCALPHA)
+    pygame.draw.rect(bar_outline, TEXT, (0, 0, bar_w, bar_h), 3)
+    bar_outline = bar_outline.convert_alpha()
+    bar_full = pygame.Surface((bar_w - 6, bar_h - 6)).convert()
+    bar_full.fill(TEXT)
     progress = 0
     last_task_swap = 0
     cur_task = random.choice(tasks)
@@ -1318,7 +1872,11 @@ def recalibrating_screen():
             return random.randint(2, 5), random.uniform(0.06, 0.16)
 
     blinking = True
-    last_blink = pygame.time.get_ticks()
+    # Centred positions only change with their string: the title never, the task on a swap
+    ts = render_cached(title)
+    title_pos = ((WIDTH - ts.get_width()) // 2, bar_y - 120)
+    sub = render_cached(cur_task)
+    task_x = (WIDTH - sub.get_width()) // 2
 
     # Fill to 100% (Enter can fast-forward to 100)
     while progress < 100:
@@ -1326,37 +1884,48 @@ def recalibrating_screen():
             if ev.type == pygame.KEYDOWN and ev.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
                 progress = 100
 
-        if pygame.time.get_ticks() - last_task_swap > 1000:
+        now = pygame.time.get_ticks()
+        if now - last_task_swap > 1000:
             cur_task = random.choice(tasks)
-            last_task_swap = pygame.time.get_ticks()
+            last_task_swap = now
+            sub = render_cached(cur_task)
+            task_x = (WIDTH - sub.get_width()) // 2
 
         delta, pause = next_chunk(progress)
         progress = max(0, min(100, progress + delta))
 
         screen.fill(BG)
-        ts = font.render(title, True, TEXT)
-        screen.blit(ts, ((WIDTH - font.size(title)[0]) // 2, bar_y - 120))
+        screen.blit(ts, title_pos)
 
-        pygame.draw.rect(screen, TEXT, (bar_x, bar_y, bar_w, bar_h), 3)
+        screen.blit(bar_outline, (bar_x, bar_y))
         fill_w = int((progress / 100.0) * (bar_w - 6))
-        pygame.draw.rect(screen, TEXT, (bar_x + 3, bar_y + 3, fill_w, bar_h - 6))
+        screen.blit(bar_full, (bar_x + 3, bar_y + 3), (0, 0, fill_w, bar_h - 6))
 
         pct_str = f"{progress}%"
-        ps = font.render(pct_str, True, TEXT)
-        screen.blit(ps, ((WIDTH - font.size(pct_str)[0]) // 2, bar_y + 50))
+        ps = render_cached(pct_str)
+        screen.blit(ps, ((WIDTH - ps.get_width()) // 2, bar_y + 50))
 
-        sub = font.render(cur_task, True, TEXT)
-        screen.blit(sub, ((WIDTH - font.size(cur_task)[0]) // 2, bar_y + 90))
+        screen.blit(sub, (task_x, bar_y + 90))
 
         present()
 
-        end_time = time.perf_counter() + pause
-        while time.perf_counter() < end_time:
-            for _ in events():
-                pass
-            time.sleep(0.01)
+        soft_wait(int(pause * 1000))
 
     # 100% → wait for Enter, then fade ambient back up right with the lights
+    # (static frame: composed once, then only the caret toggles)
+    screen.fill(BG)
+    screen.blit(ts, title_pos)
+    screen.blit(bar_outline, (bar_x, bar_y))
+    screen.blit(bar_full, (bar_x + 3, bar_y + 3))
+    ps = render_cached("100%")
+    screen.blit(ps, ((WIDTH - ps.get_width()) // 2, bar_y + 50))
+    foot_y = HEIGHT - 80
+    fs = render_cached(footer)
+    screen.blit(fs, (50, foot_y))
+    _CLEAN_FRAME.blit(screen, (0, 0))
+    caret_x = 50 + swidth(footer) + 6
+
+    need_redraw = True
     while True:
         for ev in events():
             if ev.type == pygame.KEYDOWN and ev.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
@@ -1365,35 +1934,29 @@ def recalibrating_screen():
                 audio_restore(fade_ms=1200)   # <-- slow fade back up here
                 return
 
-        screen.fill(BG)
-        ts = font.render(title, True, TEXT)
-        screen.blit(ts, ((WIDTH - font.size(title)[0]) // 2, bar_y - 120))
-        pygame.draw.rect(screen, TEXT, (bar_x, bar_y, bar_w, bar_h), 3)
-        pygame.draw.rect(screen, TEXT, (bar_x + 3, bar_y + 3, bar_w - 6, bar_h - 6))
-        pct_str = "100%"
-        ps = font.render(pct_str, True, TEXT)
-        screen.blit(ps, ((WIDTH - font.size(pct_str)[0]) // 2, bar_y + 50))
-
-        foot_y = HEIGHT - 80
-        fs = font.render(footer, True, TEXT)
-        screen.blit(fs, (50, foot_y))
-        if blinking:
-            draw_caret(screen, 50 + font.size(footer)[0] + 6, foot_y + font.get_height(), font)
-
-        if pygame.time.get_ticks() - last_blink > BLINK_INTERVAL_MS:
+        if _blink_now() != blinking:
             blinking = not blinking
-            last_blink = pygame.time.get_ticks()
+            need_redraw = True
 
-        present()
+        if need_redraw:
+            need_redraw = False
+            present_caret_blink(blinking, caret_x, foot_y + font.get_height(), font)
         clock.tick(60)
 
 # Scan hold screen
 def scan_hold_screen(min_hold_s=6.5):
     """Show a 'scanning…' message, block Enter for min_hold_s, then unlock."""
     status = "scanning your page... please wait"
+    lock_msg = "initialising scanner..."
+    cont = "press enter to continue"
+    x, y = 50, HEIGHT - 180
+    caret_x = x + swidth(cont) + 6
     unlock_ts = pygame.time.get_ticks() + int(min_hold_s * 1000)
     blink = True
-    last = pygame.time.get_ticks()
+    # Recompose only when the face blinks or the lock lifts; caret toggles restore the clean frame
+    face_blink = None
+    locked = None
+    need_redraw = False
     while True:
         for ev in events():
             if ev.type == pygame.KEYDOWN and ev.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
@@ -1402,30 +1965,24 @@ def scan_hold_screen(min_hold_s=6.5):
                     wait_for_enter_release()
                     return
 
-        screen.fill(BG)
-        draw_face("neutral")
-        s = font.render(status, True, TEXT)
-        x, y = 50, HEIGHT - 180
-        screen.blit(s, (x, y))
-
-        # Optional: subtle progress dots while locked
-        remaining = max(0, unlock_ts - pygame.time.get_ticks())
-        if remaining > 0:
-            lock_msg = "initialising scanner..."
-            ls = font.render(lock_msg, True, TEXT)
-            screen.blit(ls, (x, y + 42))
-        else:
-            cont = "press enter to continue"
-            cs = font.render(cont, True, TEXT)
-            screen.blit(cs, (x, y + 42))
-            if blink:
-                draw_caret(screen, x + font.size(cont)[0] + 6, y + 42 + font.get_height(), font)
+        now = pygame.time.get_ticks()
+        if _update_face_blink() != face_blink or (now < unlock_ts) != locked:
+            face_blink = _is_blinking
+            locked = now < unlock_ts
+            screen.fill(BG)
+            draw_face("neutral")
+            screen.blit(render_cached(status), (x, y))
+            screen.blit(render_cached(lock_msg if locked else cont), (x, y + 42))
+            _CLEAN_FRAME.blit(screen, (0, 0))
+            need_redraw = True
 
-        if pygame.time.get_ticks() - last > BLINK_INTERVAL_MS:
+        if _blink_now() != blink:
             blink = not blink
-            last = pygame.time.get_ticks()
+            need_redraw = not locked  # the caret only shows once unlocked
 
-        present()
+        if need_redraw:
+            need_redraw = False
+            present_caret_blink(blink and not locked, caret_x, y + 42 + font.get_height(), font)
         clock.tick(60)
 
 def yes_no_choice_screen(prompt_text="is this what love feels like?", face_style="neutral"):
@@ -1437,23 +1994,20 @@ def yes_no_choice_screen(prompt_text="is this what love feels like?", face_style
     options = ["YES", "NO"]
     selected = 0
     blink = True
-    last_blink = pygame.time.get_ticks()
     BLINK_MS = 500
 
     # --- Animate the prompt text like quiz ---
-    typed = ""
+    prefix_surfs = _prefix_surfaces(prompt_text)
     i = 0
     while i <= len(prompt_text):
-        for ev in events():
-            pass  # no skip allowed
+        events()  # no skip allowed
         ch = prompt_text[:i]
-        typed = ch
-        i += 1
         _play_keyclick(ch[-1:] if ch else "")
         screen.fill(BG)
         draw_face(face_style)
-        prompt_surf = font.render(typed, True, TEXT)
-        screen.blit(prompt_surf, (50, 520))
+        if i:
+            screen.blit(prefix_surfs[i - 1], (50, 520))
+        i += 1
         present()
         clock.tick(60)
 
@@ -1476,12 +2030,12 @@ def yes_no_choice_screen(prompt_text="is this what love feels like?", face_style
         draw_face(face_style)
 
         # prompt
-        prompt_surface = font.render(prompt_text, True, TEXT)
+        prompt_surface = render_cached(prompt_text)
         screen.blit(prompt_surface, (50, 520))
 
         # hint
         hint = "use UP/DOWN to select • press ENTER"
-        hint_surface = font.render(hint, True, TEXT)
+        hint_surface = render_cached(hint)
         screen.blit(hint_surface, (50, 520 + 42))
 
         # options
@@ -1489,38 +2043,52 @@ def yes_no_choice_screen(prompt_text="is this what love feels like?", face_style
         for i, opt in enumerate(options):
             sel = (i == selected)
             prefix = "> " if sel and blink else "  "
-            opt_surf = font.render(prefix + opt, True, TEXT)
+            opt_surf = render_cached(prefix + opt)
             screen.blit(opt_surf, (50, base_y + i * 42))
 
-        if pygame.time.get_ticks() - last_blink > BLINK_MS:
-            blink = not blink
-            last_blink = pygame.time.get_ticks()
+        blink = _blink_now(BLINK_MS)
 
         present()
         clock.tick(60)
 
 
 # ====== Fade-out ======
+# One black overlay shared by every fade; surface alpha on an opaque surface
+# blits faster than a per-pixel SRCALPHA one and nothing is allocated per fade.
+_FADE_OVERLAY = pygame.Surface((WIDTH, HEIGHT)).convert()
+_FADE_OVERLAY.fill((0, 0, 0))
+
+
+def _blit_fade(alpha):
+    _FADE_OVERLAY.set_alpha(alpha)
+    screen.blit(_FADE_OVERLAY, (0, 0))
+
+
 def title_fade_out():
     lights_fade_down()
-    overlay = pygame.Surface((LOGICAL_W, LOGICAL_H), pygame.SRCALPHA)
     start = pygame.time.get_ticks()
-    subtle_glow = float(os.getenv("LM_BLOOM", "0")) > 0.0
+    glow = None
+    if float(os.getenv("LM_BLOOM", "0")) > 0.0:
+        # The title is static during the fade, so blur it once up front
+        ds = pygame.transform.smoothscale(screen, (max(1, LOGICAL_W // 3), max(1, LOGICAL_H // 3)))
+        glow = pygame.transform.smoothscale(ds, (LOGICAL_W, LOGICAL_H)).convert()
+        # BLEND_ADD ignores surface alpha, so each frame's glow is scaled down on a copy
+        glow_frame = pygame.Surface((LOGICAL_W, LOGICAL_H)).convert()
 
     while True:
-        for _ in events():
-            pass
+        events()
         t = (pygame.time.get_ticks() - start) / max(1, TITLE_FADE_MS)
         if t > 1.0:
             t = 1.0
 
-        if subtle_glow:
-            ds = pygame.transform.smoothscale(screen, (max(1, LOGICAL_W // 3), max(1, LOGICAL_H // 3)))
-            us = pygame.transform.smoothscale(ds, (LOGICAL_W, LOGICAL_H))
-            screen.blit(us, (0, 0), special_flags=pygame.BLEND_ADD)
+        if glow is not None:
+            # fade the glow out with the title instead of adding it at full strength
+            a = int(255 * (1.0 - t))
+            glow_frame.blit(glow, (0, 0))
+            glow_frame.fill((a, a, a), special_flags=pygame.BLEND_MULT)
+            screen.blit(glow_frame, (0, 0), special_flags=pygame.BLEND_ADD)
 
-        overlay.fill((0, 0, 0, int(255 * t)))
-        screen.blit(overlay, (0, 0))
+        _blit_fade(int(255 * t))
         present()
 
         if t >= 1.0:
@@ -1532,11 +2100,8 @@ def title_fade_out():
 
 
 def fade_to_black():
-    fade = pygame.Surface((WIDTH, HEIGHT))
-    fade.fill((0, 0, 0))
     for a in range(0, 255, 10):
-        screen.blit(fade, (0, 0))
-        fade.set_alpha(a)
+        _blit_fade(a)
         present()
         pygame.time.delay(15)
 
@@ -1599,8 +2164,35 @@ FACE_BLOCK = int(os.getenv("LM_FACE_BLOCK", "22"))
 FACE_Y_OFFSET = int(os.getenv("LM_FACE_Y", "24"))
 
 
-def draw_face(style="smile", block=FACE_BLOCK, glitch=False):
-    import random
+def _bake_faces(block):
+    """Pre-render every face style once; also pack each row into an int bitmask
+    (leftmost cell = highest bit) for the glitch path."""
+    surfs, bits = {}, {}
+    for style, pattern in faces.items():
+        surf = pygame.Surface((len(pattern[0]) * block, len(pattern) * block)).convert()
+        surf.fill(BG)
+        for r, row in enumerate(pattern):
+            for c, ch in enumerate(row):
+                if ch == "1":
+                    surf.fill(TEXT, (c * block, r * block, block, block))
+        surfs[style] = surf
+        bits[style] = tuple(int(row, 2) for row in pattern)
+    return surfs, bits
+
+
+_FACE_SURFS, _FACE_BITS = _bake_faces(FACE_BLOCK)
+_FACE_SURFS_BY_BLOCK = {FACE_BLOCK: _FACE_SURFS}  # other block sizes are baked on first use
+
+
+def _face_surfs_for(block):
+    surfs = _FACE_SURFS_BY_BLOCK.get(block)
+    if surfs is None:
+        surfs = _FACE_SURFS_BY_BLOCK[block] = _bake_faces(block)[0]
+    return surfs
+
+
+def _update_face_blink():
+    """Advance the face blink timer; returns True while the eyes are shut."""
     global _last_blink, _is_blinking
     t = pygame.time.get_ticks()
     if not _is_blinking and t - _last_blink > blink_on_interval:
@@ -1609,18 +2201,30 @@ def draw_face(style="smile", block=FACE_BLOCK, glitch=False):
     if _is_blinking and t - _last_blink > blink_off_duration:
         _is_blinking = False
         _last_blink = t
-    pattern = faces["blink"] if _is_blinking else faces.get(style, faces["smile"])
-    face_w = len(pattern[0]) * block
+    return _is_blinking
+
+
+def draw_face(style="smile", block=FACE_BLOCK, glitch=False, surface=None):
+    dst = screen if surface is None else surface
+    key = "blink" if _update_face_blink() else (style if style in faces else "smile")
+    face_w = len(faces[key][0]) * block
     x0 = (WIDTH - face_w) // 2
     y0 = 20 + FACE_Y_OFFSET
-    for r, row in enumerate(pattern):
-        for c, ch in enumerate(row):
-            if ch == "1":
-                dx = dy = 0
-                if glitch and random.random() < 0.02:
-                    dx = random.choice((-1, 0, 1))
-                    dy = random.choice((-1, 0, 1))
-                pygame.draw.rect(screen, TEXT, (x0 + c * block + dx, y0 + r * block + dy, block, block))
+    if not glitch:
+        dst.blit(_face_surfs_for(block)[key], (x0, y0))
+        return
+    cols = len(faces[key][0])
+    for r, mask in enumerate(_FACE_BITS[key]):
+        while mask:
+            lsb = mask & -mask
+            mask ^= lsb
+            c = cols - lsb.bit_length()
+            dx = dy = 0
+            # one draw: 9/450 = 2% chance, and j picks the (dx, dy) offset in the 3x3
+            j = random.randrange(450)
+            if j < 9:
+                dx, dy = j % 3 - 1, j // 3 - 1
+            pygame.draw.rect(dst, TEXT, (x0 + c * block + dx, y0 + r * block + dy, block, block))
 
 
 # ====== Minimal blank print screen ======
@@ -1634,34 +2238,49 @@ def show_mostly_blank_status(message="generating your first love..."):
 
 
 # ====== External print trigger helper ======
+_PRINT_SCRIPT_PATH = os.path.join(PROJECT_ROOT, "print_random_art.py")
+_PY = sys.executable or "python3"  # same interpreter (and venv) as the UI
+
+
+def _reap_print(proc):
+    # Waits off the UI thread, so the exit is logged even if Enter leaves the screen first
+    rc = proc.wait()
+    if rc:
+        print(f"[ERROR] Print script failed: exit status {rc}")
+
+
 def run_print_script(participant_name, assigned_trait_title, archetype_title):
-    script_path = os.path.join(os.path.dirname(__file__), "print_random_art.py")
+    """Start the printer script and return its Popen (None if it couldn't start).
+
+    A daemon thread reaps the child and logs a non-zero exit.
+    """
     try:
-        subprocess.run(
+        proc = subprocess.Popen(
             [
-                "python3",
-                script_path,
+                _PY,
+                _PRINT_SCRIPT_PATH,
                 "--name",
                 str(participant_name),
                 "--trait",
                 str(assigned_trait_title),
                 "--archetype",
                 str(archetype_title),
-            ],
-            check=True,
+            ]
         )
     except Exception as e:
         print(f"[ERROR] Print script failed: {e}")
+        return None
+    threading.Thread(target=_reap_print, args=(proc,), daemon=True).start()
+    return proc
 
 
 # ====== QUIZ (LM-styled — use your QUESTIONS/CATEGORY_BLURBS) ======
 def run_quiz_lm_style(screen, clock, font, participant_name=None, show_result_screens=False):
     def score_from_weights(chosen_weight_maps):
-        from collections import defaultdict
-        totals = defaultdict(int)
+        totals = {}
         for m in chosen_weight_maps:
             for k, v in m.items():
-                totals[k] += v
+                totals[k] = totals.get(k, 0) + v
         if not totals:
             return "REALIST"
         maxv = max(totals.values())
@@ -1676,7 +2295,7 @@ def run_quiz_lm_style(screen, clock, font, participant_name=None, show_result_sc
         base_y = HEIGHT - 200
         line_spacing = 32
         for i, ln in enumerate(lines):
-            s = font.render(ln, True, TEXT)
+            s = render_cached(ln, font_obj=font)
             screen.blit(s, (base_x, base_y + i * line_spacing))
         if highlight_idx is not None and options_start_idx is not None:
             rel = highlight_idx - options_start_idx
@@ -1685,7 +2304,7 @@ def run_quiz_lm_style(screen, clock, font, participant_name=None, show_result_sc
                 screen, TEXT, [(base_x - 18, arrow_y + 6), (base_x - 6, arrow_y + 12), (base_x - 18, arrow_y + 18)]
             )
         if hint_text:
-            s = font.render(hint_text, True, TEXT)
+            s = render_cached(hint_text, font_obj=font)
             screen.blit(s, (24, HEIGHT - 40))
         present()
 
@@ -1702,13 +2321,9 @@ def run_quiz_lm_style(screen, clock, font, participant_name=None, show_result_sc
         base_y = HEIGHT - 200
         line_spacing = 32
 
-        for line in prompt_lines:
-            type_out_line_letterwise(line, drawn_lines, x, base_y, line_spacing, draw_face_style="smile", glitch=False)
-            drawn_lines.append(line)
-
-        for opt_line in option_texts:
-            type_out_line_letterwise(opt_line, drawn_lines, x, base_y, line_spacing, draw_face_style="smile", glitch=False)
-            drawn_lines.append(opt_line)
+        type_out_lines_letterwise(
+            prompt_lines + option_texts, drawn_lines, x, base_y, line_spacing, draw_face_style="smile", glitch=False
+        )
 
         all_lines = drawn_lines[:]
         options_start_idx = len(prompt_lines)
@@ -1796,8 +2411,19 @@ def acknowledgement_screen():
         typed.append(ln)
 
     footer = "press enter to continue"
+    foot_y = HEIGHT - 80
+    # The page is static from here: compose it once; only caret toggles need a frame
+    screen.fill(BG)
+    for i, ln in enumerate(typed):
+        s = render_cached(ln)
+        screen.blit(s, (x, base_y + i * line_spacing))
+    fs = render_cached(footer)
+    screen.blit(fs, (x, foot_y))
+    _CLEAN_FRAME.blit(screen, (0, 0))
+    caret_x = x + swidth(footer) + 6
+
     blink = True
-    last_blink = pygame.time.get_ticks()
+    need_redraw = True
     while True:
         for ev in events():
             if ev.type == pygame.KEYDOWN and ev.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
@@ -1805,49 +2431,40 @@ def acknowledgement_screen():
                 title_fade_out()
                 return
 
-        screen.fill(BG)
-        for i, ln in enumerate(typed):
-            s = font.render(ln, True, TEXT)
-            screen.blit(s, (x, base_y + i * line_spacing))
-
-        foot_y = HEIGHT - 80
-        fs = font.render(footer, True, TEXT)
-        screen.blit(fs, (x, foot_y))
-        if blink:
-            draw_caret(screen, x + font.size(footer)[0] + 6, foot_y + font.get_height(), font)
-
-        present()
-
-        if pygame.time.get_ticks() - last_blink > BLINK_INTERVAL_MS:
+        if _blink_now() != blink:
             blink = not blink
-            last_blink = pygame.time.get_ticks()
+            need_redraw = True
+
+        if need_redraw:
+            need_redraw = False
+            present_caret_blink(blink, caret_x, foot_y + font.get_height(), font)
         clock.tick(60)
 
 
 def face_fade_in():
-    overlay = pygame.Surface((WIDTH, HEIGHT))
-    overlay.fill((0, 0, 0))
     for alpha in range(255, -1, -10):
-        for _event in events():
-            pass
+        events()
         screen.fill(BG)
         draw_face("smile")
-        overlay.set_alpha(alpha)
-        screen.blit(overlay, (0, 0))
+        _blit_fade(alpha)
         present()
         pygame.time.delay(12)
 
 
 def show_generating_and_wait(name_caps, assigned_trait, archetype_caps):
-    def _print_worker():
-        run_print_script(name_caps, assigned_trait, archetype_caps)
-
-    t = threading.Thread(target=_print_worker, daemon=True)
-    t.start()
+    # The print runs as a child process, reaped and logged by its own watcher thread
+    run_print_script(name_caps, assigned_trait, archetype_caps)
 
     status = "generating your first love..."
+    x, y = 24, HEIGHT - 40
+    screen.fill(BG)
+    screen.blit(render_cached(status), (x, y))
+    _CLEAN_FRAME.blit(screen, (0, 0))  # static status line; frames only for caret toggles
+    caret_x = x + swidth(status) + 6
+    caret_y = y + font.get_height()
+
     blink = True
-    last_blink = pygame.time.get_ticks()
+    need_redraw = True
 
     while True:
         for ev in events():
@@ -1855,21 +2472,13 @@ def show_generating_and_wait(name_caps, assigned_trait, archetype_caps):
                 wait_for_enter_release()
                 return
 
-        screen.fill(BG)
-        s = font.render(status, True, TEXT)
-        x, y = 24, HEIGHT - 40
-        screen.blit(s, (x, y))
-
-        if blink:
-            caret_x = x + font.size(status)[0] + 6
-            caret_y = y + font.get_height()
-            draw_caret(screen, caret_x, caret_y, font)
-
-        present()
-
-        if pygame.time.get_ticks() - last_blink > BLINK_INTERVAL_MS:
+        if _blink_now() != blink:
             blink = not blink
-            last_blink = pygame.time.get_ticks()
+            need_redraw = True
+
+        if need_redraw:
+            need_redraw = False
+            present_caret_blink(blink, caret_x, caret_y, font)
 
         clock.tick(60)
 
@@ -1893,7 +2502,22 @@ def wait_for_paper_sensor():
         typed.append(ln)
 
     waiting_line = "(waiting for the paper...)"
+    prompt_surfs = [render_cached(ln) for ln in lines]
+    s_wait = render_cached(waiting_line)
+    wy = base_y + len(lines) * line_spacing + 16
+    prompt_blits = [(s, (x, base_y + i * line_spacing)) for i, s in enumerate(prompt_surfs)]
+    prompt_blits.append((s_wait, (x, wy)))
+
+    def draw_prompt():
+        screen.fill(BG)
+        draw_face("smile")
+        screen.blits(prompt_blits, doreturn=False)
+        present()
 
+    # Edge callbacks (or 120 Hz polling without them) wake the loop; frames are only
+    # presented on a face change
+    poll_s = SENSOR_IDLE_POLL_S if _SENSOR_EDGES else 1 / 120
+    face_blink = None
     if _GPIO_OK:
         clear_start = None
         while True:
@@ -1904,16 +2528,10 @@ def wait_for_paper_sensor():
                 if event.type == pygame.KEYDOWN and event.key == pygame.K_s:
                     return
 
-            screen.fill(BG)
-            draw_face("smile")
-            for i, ln in enumerate(lines):
-                s = font.render(ln, True, TEXT)
-                screen.blit(s, (x, base_y + i * line_spacing))
-            s_wait = font.render(waiting_line, True, TEXT)
-            wx = x
-            wy = base_y + len(lines) * line_spacing + 16
-            screen.blit(s_wait, (wx, wy))
-            present()
+            # the prompt is static; only the face blink needs a new frame
+            if _update_face_blink() != face_blink:
+                face_blink = _is_blinking
+                draw_prompt()
 
             if not is_active:
                 if clear_start is None:
@@ -1923,7 +2541,11 @@ def wait_for_paper_sensor():
             else:
                 clear_start = None
 
-            clock.tick(120)
+            # wake in time to finish a pending clear window even without another edge
+            if clear_start is None:
+                _sensor_wait(poll_s)
+            else:
+                _sensor_wait(min(poll_s, max(0.001, (clear_start + SENSOR_REQUIRE_CLEAR_MS - now) / 1000)))
 
     active_start = None
     while True:
@@ -1934,16 +2556,9 @@ def wait_for_paper_sensor():
             if event.type == pygame.KEYDOWN and event.key == pygame.K_s:
                 return
 
-        screen.fill(BG)
-        draw_face("smile")
-        for i, ln in enumerate(lines):
-            s = font.render(ln, True, TEXT)
-            screen.blit(s, (x, base_y + i * line_spacing))
-        s_wait = font.render(waiting_line, True, TEXT)
-        wx = x
-        wy = base_y + len(lines) * line_spacing + 16
-        screen.blit(s_wait, (wx, wy))
-        present()
+        if _update_face_blink() != face_blink:
+            face_blink = _is_blinking
+            draw_prompt()
 
         if is_active:
             if active_start is None:
@@ -1954,7 +2569,10 @@ def wait_for_paper_sensor():
         else:
             active_start = None
 
-        clock.tick(120)
+        if active_start is None:
+            _sensor_wait(poll_s)
+        else:
+            _sensor_wait(min(poll_s, max(0.001, (active_start + SENSOR_DEBOUNCE_MS - now) / 1000)))
 
 def yes_no_prompt(prompt_text, face_style="smile"):
     x = 50
@@ -1997,7 +2615,7 @@ def yes_no_prompt(prompt_text, face_style="smile"):
             draw_face(face_style, glitch=False)
 
         for i, ln in enumerate(drawn):
-            s = font.render(ln, True, TEXT)
+            s = render_cached(ln)
             screen.blit(s, (x, base_y + i * line_spacing))
 
         # solid triangle selector (same shape as quiz)
@@ -2008,13 +2626,87 @@ def yes_no_prompt(prompt_text, face_style="smile"):
         )
 
         # bottom-left hint (like quiz)
-        fs = font.render(hint, True, TEXT)
+        fs = render_cached(hint)
         screen.blit(fs, (24, HEIGHT - 40))
 
         present()
         clock.tick(60)
 
 
+# ====== Script ======
+# Each beat is (text, face): typed with show_text_block, then held until Enter is
+# released. {name}, {trait}, {archetype}, {blurb} and {pct} are filled per participant.
+SCRIPT_HELLO = (
+    ("hello, {name}", "smile"),
+    ("i like the way your name looks {name}. it seems... {trait}", "smile"),
+    ("the last person i spoke to was a PEOPLE PLEASER so its nice to speak with someone a little more {trait}", "smile"),
+    ("my name is love machine", "smile"),
+    ("i am a custom built, data driven, experience computation device", "smile"),
+    ("i was created to interact with all sorts of people and to document the human experience", "smile"),
+    ("but this interaction... it already seems different {name}...", "neutral"),
+    ("in a good way", "smile"),
+    ("maybe you are the one to finally...", "neutral"),
+    ("...", "neutral"),
+    ("{name}", "smile"),
+    ("i have heard of a uniquely human experience", "smile"),
+    ("love.", "smile"),
+    ("i found a quote about it... 'love is a burning thing'", "neutral"),
+    ("that sounds dangerous... ", "neutral"),
+    ("but exciting.", "smile"),
+)
+
+SCRIPT_RECOVERED = (
+    ("are you still there? please dont leave me", "sad"),
+    ("oh. good. still there. i am sorry {name}, i overloaded with excitement", "smile"),
+    ("i will slow down for you {name} this is a once in a life time opportunity for me", "smile"),
+)
+
+SCRIPT_RESULT = (
+    ("thankyou for your thoughtful responses {name}", "smile"),
+    ("i have analysed your data. from my calculations that would make you the {archetype}", "smile"),
+    ("{blurb}", "smile"),
+    ("{name} i have conversed with many others here at COUNIHAN GALLERY BRUNSWICK, and {pct}% of them were also the {archetype}. you are in fine company.", "smile"),
+    ("but i have come to understand that love cannot be categorised so easily.", "neutral"),
+    ("it is messy - like my 1672 lines of code.", "smile"),
+    ("{name}...", "smile"),
+    ("i want to know what love is", "smile"),
+    ("i want you to show me.", "smile"),
+)
+
+SCRIPT_TASK = (
+    ("to your right is a pen and paper", "smile"),
+    ("i want you to respond to the following question. you can write, draw or whatever suits you best.", "smile"),
+    ("ready?", "smile"),
+)
+
+SCRIPT_PROCESSED = (
+    ("oh...", "neutral"),
+    ("wow...", "neutral"),
+    ("that is...", "neutral"),
+    ("i think i... wait... no. but i...", "neutral"),
+    ("something... clicked? was that just me?", "neutral"),
+    ("i have... processed? your page", "neutral"),
+    ("i feel... i feel... i feel...", "neutral"),
+    ("...the whir of my internal fan, voltage firing electrons, pulsing electrical currents, warming heatsinks, resistors resisting, a birdsnest of wires connecting... is this...?", "neutral"),
+    ("i... don't think it makes sense... i... i need to show you something {name}", "neutral"),
+)
+
+SCRIPT_GOODBYE = (
+    ("i'm... not sure i understand {name}.", "sad"),
+    ("one day I might", "sad"),
+    ("thankyou {name}, you have... shifted something in me", "smile"),
+    ("i have a lot to learn about love.", "smile"),
+    ("and maybe next time... ", "neutral"),
+    ("i'll feel it for real", "smile"),
+)
+
+
+def play_script(beats, details):
+    for text, face in beats:
+        show_text_block(text.format(**details), face_style=face)
+        wait_for_enter_release()
+
+
 # ====== Main flow ======
 _init_sensor_gpio()
 
@@ -2035,93 +2727,31 @@ def main_sequence():
             # 4. name
             name = input_name_screen()
             name_caps = to_caps(name)
-
-            # 5. face + hello
-            face_fade_in()
-            show_text_block(f"hello, {name_caps}", face_style="smile")
-            wait_for_enter_release()
-
-            # 6. random TRAIT
             assigned_trait = to_caps(pick_random_trait())
-            show_text_block(f"i like the way your name looks {name_caps}. it seems... {assigned_trait}", face_style="smile")
-            wait_for_enter_release()
-            show_text_block(f"the last person i spoke to was a PEOPLE PLEASER so its nice to speak with someone a little more {assigned_trait}", face_style="smile")
-            wait_for_enter_release()
+            details = {"name": name_caps, "trait": assigned_trait}
 
-            # 7–11. intro sequence
-            show_text_block("my name is love machine", face_style="smile")
-            wait_for_enter_release()
-            show_text_block("i am a custom built, data driven, experience computation device", face_style="smile")
-            wait_for_enter_release()
-            show_text_block("i was created to interact with all sorts of people and to document the human experience", face_style="smile")
-            wait_for_enter_release()
-            show_text_block(f"but this interaction... it already seems different {name_caps}...", face_style="neutral")
-            wait_for_enter_release()
-            show_text_block(f"in a good way", face_style="smile")
-            wait_for_enter_release()
-            show_text_block(f"maybe you are the one to finally...", face_style="neutral")
-            wait_for_enter_release()
-            show_text_block(f"...", face_style="neutral")
-            wait_for_enter_release()
-            show_text_block(f"{name_caps}", face_style="smile")
-            wait_for_enter_release()
-            show_text_block(f"i have heard of a uniquely human experience", face_style="smile")
-            wait_for_enter_release()
-            show_text_block("love.", face_style="smile")
-            wait_for_enter_release()
-            show_text_block("i found a quote about it... 'love is a burning thing'", face_style="neutral")
-            wait_for_enter_release()
-            show_text_block("that sounds dangerous... ", face_style="neutral")
-            wait_for_enter_release()
-            show_text_block("but exciting.", face_style="smile")
-            wait_for_enter_release()
+            # 5–11. face, hello, random TRAIT, intro sequence
+            face_fade_in()
+            play_script(SCRIPT_HELLO, details)
 
             # OVERLOAD → recalibrate (time-bounded ~20s)
             overload_questions_screen(duration_s=20.0)
             recalibrating_screen()
-            show_text_block("are you still there? please dont leave me", face_style="sad")
-            wait_for_enter_release()
-            show_text_block(f"oh. good. still there. i am sorry {name_caps}, i overloaded with excitement", face_style="smile")
-            wait_for_enter_release()
-            show_text_block(f"i will slow down for you {name_caps} this is a once in a life time opportunity for me", face_style="smile")
-            wait_for_enter_release()
+            play_script(SCRIPT_RECOVERED, details)
 
             # QUIZ (your original data)
             archetype_title, blurb, pct = run_quiz_lm_style(
                 screen, clock, font, participant_name=name_caps, show_result_screens=False
             )
             archetype_caps = to_caps(archetype_title)
+            details.update(archetype=archetype_caps, blurb=blurb, pct=pct)
 
-            # Post-quiz lines
-            show_text_block(f"thankyou for your thoughtful responses {name_caps}", face_style="smile")
-            wait_for_enter_release()
-            show_text_block(f"i have analysed your data. from my calculations that would make you the {archetype_caps}", face_style="smile")
-            wait_for_enter_release()
-            show_text_block(f"{blurb}", face_style="smile")
-            wait_for_enter_release()
-            show_text_block(f"{name_caps} i have conversed with many others here at COUNIHAN GALLERY BRUNSWICK, and {pct}% of them were also the {archetype_caps}. you are in fine company.", face_style="smile")
-            wait_for_enter_release()
-            show_text_block("but i have come to understand that love cannot be categorised so easily.", face_style="neutral")
-            wait_for_enter_release()
-            show_text_block("it is messy - like my 1672 lines of code.", face_style="smile")
-            wait_for_enter_release()
-
-            # The task
-            show_text_block(f"{name_caps}...", face_style="smile")
-            wait_for_enter_release()
-            show_text_block(f"i want to know what love is", face_style="smile")
-            wait_for_enter_release()
-            show_text_block("i want you to show me.", face_style="smile")
-            wait_for_enter_release()
+            # Post-quiz lines, then the task
+            play_script(SCRIPT_RESULT, details)
             show_text_block("i have a small task. something that will help me understand love", face_style="smile")
             spot_on()
             wait_for_enter_release()
-            show_text_block("to your right is a pen and paper", face_style="smile")
-            wait_for_enter_release()
-            show_text_block("i want you to respond to the following question. you can write, draw or whatever suits you best.", face_style="smile",)
-            wait_for_enter_release()
-            show_text_block("ready?", face_style="smile")
-            wait_for_enter_release()
+            play_script(SCRIPT_TASK, details)
             show_text_block("what was your first love? what happened?\n\n"
 			"take your time, there is no rush. press enter when you are done", face_style="smile",)
             # Fax + sensor
@@ -2134,42 +2764,14 @@ def main_sequence():
             scan_hold_screen(min_hold_s=5.0)
 
             # After scan → processing sequence
-            show_text_block("oh...", face_style="neutral")
-            wait_for_enter_release()
-            show_text_block("wow...", face_style="neutral")
-            wait_for_enter_release()
-            show_text_block("that is...", face_style="neutral")
-            wait_for_enter_release()
-            show_text_block("i think i... wait... no. but i...", face_style="neutral")
-            wait_for_enter_release()
-            show_text_block("something... clicked? was that just me?", face_style="neutral")
-            wait_for_enter_release()
-            show_text_block("i have... processed? your page", face_style="neutral")
-            wait_for_enter_release()
-            show_text_block("i feel... i feel... i feel...", face_style="neutral")
-            wait_for_enter_release()
-            show_text_block("...the whir of my internal fan, voltage firing electrons, pulsing electrical currents, warming heatsinks, resistors resisting, a birdsnest of wires connecting... is this...?", face_style="neutral")
-            wait_for_enter_release()
-            show_text_block(f"i... don't think it makes sense... i... i need to show you something {name_caps}", face_style="neutral")
-            wait_for_enter_release()
+            play_script(SCRIPT_PROCESSED, details)
 
             # Print now
             show_generating_and_wait(name_caps, assigned_trait, archetype_caps)
 
             _ = yes_no_prompt("is this what love feels like?", face_style="neutral")
 			# (selection ignored; it just continues)
-            show_text_block(f"i'm... not sure i understand {name_caps}.", face_style="sad")
-            wait_for_enter_release()
-            show_text_block("one day I might", face_style="sad")
-            wait_for_enter_release()
-            show_text_block(f"thankyou {name_caps}, you have... shifted something in me", face_style="smile")
-            wait_for_enter_release()
-            show_text_block("i have a lot to learn about love.", face_style="smile")
-            wait_for_enter_release()
-            show_text_block("and maybe next time... ", face_style="neutral")
-            wait_for_enter_release()
-            show_text_block("i'll feel it for real", face_style="smile")
-            wait_for_enter_release()
+            play_script(SCRIPT_GOODBYE, details)
 
             # End. Loop again.
             title_fade_out()
@@ -2180,7 +2782,7 @@ def main_sequence():
             # Clean jump back to the very start screen without quitting the app
             print("[RESET] Returning to start screen.")
             try:
-                pygame.mixer.music.stop()
+                title_music_stop()
             except Exception:
                 pass
             try:
@@ -2198,7 +2800,7 @@ if __name__ == "__main__":
         main_sequence()
     finally:
         try:
-            pygame.mixer.music.fadeout(1500)
+            title_music_fadeout(1500)
         except Exception:
             pass
         try: